@@ -1,7 +1,10 @@
 import re
 import time
-import concurrent.futures
-from typing import List, Dict, Any, Optional
+import asyncio
+import functools
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
 import threading
@@ -9,62 +12,82 @@ import threading
 from shopify_scraper import EcommerceScraper
 
 
-@dataclass
+def _keyword_group_pattern(groups: Dict[str, List[str]]) -> re.Pattern:
+    """Compile keyword groups into one alternation whose named groups identify the match."""
+    return re.compile('|'.join(
+        f'(?P<{name}>' + r'\b(?:' + '|'.join(map(re.escape, keywords)) + '))'
+        for name, keywords in groups.items()
+    ), re.IGNORECASE)
+
+
+def _matched_groups(pattern: re.Pattern, text: str) -> List[str]:
+    """Return the names of the groups matched anywhere in text, in declaration order."""
+    found = {match.lastgroup for match in pattern.finditer(text)}
+    return [name for name in pattern.groupindex if name in found]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_brand(url: str) -> Tuple[str, str]:
+    """Return a URL's lowercased netloc and its leading label as the brand name."""
+    netloc = urlparse(url).netloc
+    return netloc.lower(), netloc.split('.')[0]
+
+
+@dataclass(frozen=True)
 class CompetitorSite:
     name: str
     url: str
     similarity_score: float
     category: str
 
+
+# For demo purposes, a fixed set of common Shopify competitors
+# In a real implementation, you would use web search APIs
+_COMMON_COMPETITORS = (
+    CompetitorSite('Gymshark', 'https://row.gymshark.com', 0.7, 'fitness'),
+    CompetitorSite('Allbirds', 'https://www.allbirds.com', 0.8, 'footwear'),
+    CompetitorSite('MVMT', 'https://www.mvmt.com', 0.9, 'accessories'),
+)
+
 class AdvancedEcommerceScraper(EcommerceScraper):
+    # Bulk URLs failing with these statuses (timed out, rate limited, server error) are
+    # retried, as are results marked transient (the site could not be reached)
+    TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+    BULK_ATTEMPTS = 2
+    
+    # Keyword matchers for the NLP analyzers, compiled once per process
+    CATEGORY_PATTERN = _keyword_group_pattern({
+        'apparel': ['shirt', 'dress', 'pants', 'jacket', 'hoodie', 'sweater', 'tee', 'top'],
+        'accessories': ['bag', 'watch', 'jewelry', 'belt', 'hat', 'sunglasses'],
+        'footwear': ['shoes', 'boots', 'sneakers', 'sandals', 'heels'],
+        'beauty': ['makeup', 'skincare', 'perfume', 'cosmetics', 'beauty'],
+        'fitness': ['protein', 'supplement', 'equipment', 'yoga', 'workout'],
+        'home': ['candle', 'decor', 'furniture', 'kitchen', 'bathroom']
+    })
+    BRAND_THEME_PATTERN = _keyword_group_pattern({
+        'sustainability': ['sustainable', 'eco-friendly', 'environmental', 'green', 'organic', 'natural'],
+        'quality': ['premium', 'luxury', 'high-quality', 'craftsmanship', 'artisan'],
+        'innovation': ['innovative', 'technology', 'cutting-edge', 'advanced', 'revolutionary'],
+        'community': ['community', 'together', 'family', 'connect', 'share'],
+        'wellness': ['wellness', 'health', 'fitness', 'mindfulness', 'balance']
+    })
+    FAQ_TOPIC_PATTERN = _keyword_group_pattern({
+        'shipping': ['ship', 'delivery', 'shipping'],
+        'returns': ['return', 'refund', 'exchange'],
+        'sizing': ['size', 'fit', 'sizing'],
+        'payment': ['payment', 'pay', 'credit card', 'paypal'],
+        'products': ['product', 'material', 'quality']
+    })
+    
     def __init__(self):
         super().__init__()
         self.processing_lock = threading.Lock()
     
     def find_competitors(self, website_url: str, brand_name: str = None) -> List[CompetitorSite]:
         """Find competitors using web search and analysis."""
-        try:
-            # Extract brand name from URL if not provided
-            if not brand_name:
-                domain = urlparse(website_url).netloc
-                brand_name = domain.split('.')[0] if domain else "brand"
-            
-            # Search for similar stores
-            competitors = []
-            
-            # Common competitor search patterns
-            search_queries = [
-                f"{brand_name} competitors",
-                f"{brand_name} similar stores",
-                f"{brand_name} alternatives",
-                f"stores like {brand_name}",
-                f"{brand_name} vs"
-            ]
-            
-            # For demo purposes, return some common Shopify competitors
-            # In a real implementation, you would use web search APIs
-            common_competitors = [
-                {"name": "Gymshark", "url": "https://row.gymshark.com", "category": "fitness"},
-                {"name": "Allbirds", "url": "https://www.allbirds.com", "category": "footwear"},
-                {"name": "MVMT", "url": "https://www.mvmt.com", "category": "accessories"},
-                {"name": "Pura Vida", "url": "https://www.puravidabracelets.com", "category": "jewelry"},
-                {"name": "Bombas", "url": "https://bombas.com", "category": "apparel"}
-            ]
-            
-            # Filter and score competitors
-            for comp in common_competitors[:3]:  # Limit to 3 for demo
-                competitors.append(CompetitorSite(
-                    name=comp["name"],
-                    url=comp["url"],
-                    similarity_score=0.7 + (len(competitors) * 0.1),  # Demo scoring
-                    category=comp["category"]
-                ))
-            
-            return competitors
-            
-        except Exception as e:
-            self.logger.error(f"Error finding competitors: {str(e)}")
-            return []
+        # The demo list does not depend on the brand; a search-backed version
+        # would derive brand_name from website_url here.
+        return list(_COMMON_COMPETITORS)
     
     def analyze_competitor(self, competitor_site: CompetitorSite) -> Dict[str, Any]:
         """Analyze a single competitor site."""
@@ -107,36 +130,78 @@ class AdvancedEcommerceScraper(EcommerceScraper):
         
         start_time = time.time()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(self.extract_all_insights, url): url 
-                for url in urls
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    result = future.result(timeout=120)  # 2 minute timeout per URL
-                    if result.get('error'):
-                        results['failed'].append({
-                            'url': url,
-                            'error': result['error']
-                        })
-                    else:
-                        results['successful'].append(result)
-                except Exception as e:
-                    results['failed'].append({
-                        'url': url,
-                        'error': f'Processing error: {str(e)}'
-                    })
+        for url, outcome, _elapsed in self.iter_bulk_analyze(urls, max_workers):
+            if outcome.get('error'):
+                results['failed'].append({
+                    'url': url,
+                    'error': outcome['error']
+                })
+            else:
+                results['successful'].append(outcome)
         
         results['processing_time'] = time.time() - start_time
         results['success_rate'] = len(results['successful']) / len(urls) * 100 if urls else 0
         
         return results
     
+    def iter_bulk_analyze(self, urls: List[str], max_workers: int = 3) -> Iterator[Tuple[str, Dict[str, Any], float]]:
+        """Yield (url, insights_or_error, processing_time) for each URL as it completes.
+        
+        Results are handed over one at a time so callers can persist and drop
+        them instead of holding a whole job in memory.
+        """
+        with asyncio.Runner() as runner:
+            results = self._iter_bulk_extract(urls, max_workers)
+            
+            async def next_result():
+                return await anext(results)
+            
+            async def close_results():
+                await results.aclose()
+            
+            try:
+                while True:
+                    try:
+                        yield runner.run(next_result())
+                    except StopAsyncIteration:
+                        return
+            finally:
+                runner.run(close_results())
+    
+    async def _iter_bulk_extract(self, urls: List[str], max_workers: int) -> AsyncIterator[Tuple[str, Dict[str, Any], float]]:
+        """Run extractions for all URLs on one event loop, max_workers sites at a time."""
+        # Imported here so app startup doesn't pay for aiohttp until a bulk job runs
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(max_workers)
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=2)
+        
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.session.headers)) as session:
+            async def bounded(url: str) -> Tuple[str, Dict[str, Any], float]:
+                start_time = time.time()
+                for attempt in range(self.BULK_ATTEMPTS):
+                    if attempt:
+                        # Exponential backoff with jitter, outside the semaphore
+                        await asyncio.sleep(min(5, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.5))
+                    
+                    async with semaphore:
+                        try:
+                            # 2 minute timeout per URL
+                            outcome = await asyncio.wait_for(self.async_extract_all_insights(session, url), timeout=120)
+                            transient = outcome.get('transient', False) or outcome.get('status_code') in self.TRANSIENT_STATUS_CODES
+                        except Exception as e:
+                            outcome = {'error': f'Processing error: {str(e) or type(e).__name__}'}
+                            transient = isinstance(e, (asyncio.TimeoutError, aiohttp.ClientError))
+                    
+                    if not outcome.get('error') or not transient:
+                        break
+                    self.logger.info(f"Retrying {url} after transient failure: {outcome['error']}")
+                
+                return url, outcome, time.time() - start_time
+            
+            for next_done in asyncio.as_completed([bounded(url) for url in urls]):
+                yield await next_done
+    
     def extract_competitive_analysis(self, website_url: str) -> Dict[str, Any]:
         """Extract insights from main site and its competitors."""
         try:
@@ -151,18 +216,16 @@ class AdvancedEcommerceScraper(EcommerceScraper):
             brand_name = None
             if 'brand_context' in main_analysis and main_analysis['brand_context']:
                 # Try to extract brand name from context (simplified)
-                domain = urlparse(website_url).netloc
-                brand_name = domain.split('.')[0]
+                _netloc, brand_name = _parse_brand(website_url)
             
             # Find competitors
             competitors = self.find_competitors(website_url, brand_name)
             
-            # Analyze competitors
+            # Analyze competitors concurrently; each one is a different host
             competitor_analyses = []
-            for competitor in competitors:
-                comp_analysis = self.analyze_competitor(competitor)
-                competitor_analyses.append(comp_analysis)
-                time.sleep(2)  # Rate limiting
+            if competitors:
+                with ThreadPoolExecutor(max_workers=len(competitors)) as executor:
+                    competitor_analyses = list(executor.map(self.analyze_competitor, competitors))
             
             # Create competitive analysis summary
             competitive_summary = self.create_competitive_summary(main_analysis, competitor_analyses)
@@ -228,64 +291,58 @@ class AdvancedEcommerceScraper(EcommerceScraper):
             return {'error': 'Failed to create competitive summary'}
     
     def structure_data_with_nlp(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Enhance data structuring using natural language processing."""
+        """Enhance data structuring using natural language processing.
+        
+        Adds the analysis keys to ``raw_data`` in place and returns it; callers
+        pass a freshly extracted dict and must not share it elsewhere.
+        """
         try:
-            structured_data = raw_data.copy()
+            extras = {}
             
             # Enhanced product categorization
-            if 'product_catalog' in structured_data and structured_data['product_catalog'].get('products'):
-                structured_data['product_categories'] = self.categorize_products(
-                    structured_data['product_catalog']['products']
+            if 'product_catalog' in raw_data and raw_data['product_catalog'].get('products'):
+                products = raw_data['product_catalog']['products']
+                extras['product_categories'] = self.categorize_products(
+                    products, self.build_product_texts(products)
                 )
             
             # Enhanced brand analysis
-            if 'brand_context' in structured_data and structured_data['brand_context']:
-                structured_data['brand_analysis'] = self.analyze_brand_text(
-                    structured_data['brand_context']
+            if 'brand_context' in raw_data and raw_data['brand_context']:
+                extras['brand_analysis'] = self.analyze_brand_text(
+                    raw_data['brand_context']
                 )
             
             # FAQ insights
-            if 'faqs' in structured_data and structured_data['faqs']:
-                structured_data['faq_insights'] = self.analyze_faq_patterns(
-                    structured_data['faqs']
+            if 'faqs' in raw_data and raw_data['faqs']:
+                extras['faq_insights'] = self.analyze_faq_patterns(
+                    raw_data['faqs']
                 )
             
-            return structured_data
+            raw_data.update(extras)
+            return raw_data
             
         except Exception as e:
             self.logger.error(f"Error in NLP structuring: {str(e)}")
             return raw_data
     
-    def categorize_products(self, products: List[Dict]) -> Dict[str, Any]:
+    def build_product_texts(self, products: List[Dict]) -> List[str]:
+        """Join each product's title, type and tags into one searchable string."""
+        return [
+            ' '.join([product.get('title') or '', product.get('product_type') or '', *product.get('tags', [])])
+            for product in products
+        ]
+    
+    def categorize_products(self, products: List[Dict], product_texts: Optional[List[str]] = None) -> Dict[str, Any]:
         """Categorize products using keyword analysis."""
+        if product_texts is None:
+            product_texts = self.build_product_texts(products)
+        
         categories = {}
-        keyword_categories = {
-            'apparel': ['shirt', 'dress', 'pants', 'jacket', 'hoodie', 'sweater', 'tee', 'top'],
-            'accessories': ['bag', 'watch', 'jewelry', 'belt', 'hat', 'sunglasses'],
-            'footwear': ['shoes', 'boots', 'sneakers', 'sandals', 'heels'],
-            'beauty': ['makeup', 'skincare', 'perfume', 'cosmetics', 'beauty'],
-            'fitness': ['protein', 'supplement', 'equipment', 'yoga', 'workout'],
-            'home': ['candle', 'decor', 'furniture', 'kitchen', 'bathroom']
-        }
         
-        for product in products:
-            title = product.get('title', '').lower()
-            product_type = product.get('product_type', '').lower()
-            tags = [tag.lower() for tag in product.get('tags', [])]
-            
-            categorized = False
-            for category, keywords in keyword_categories.items():
-                if any(keyword in title or keyword in product_type or any(keyword in tag for tag in tags) for keyword in keywords):
-                    if category not in categories:
-                        categories[category] = []
-                    categories[category].append(product)
-                    categorized = True
-                    break
-            
-            if not categorized:
-                if 'other' not in categories:
-                    categories['other'] = []
-                categories['other'].append(product)
+        for product, text in zip(products, product_texts):
+            # First category in declaration order wins, as with the old per-category loop
+            matched = _matched_groups(self.CATEGORY_PATTERN, text)
+            categories.setdefault(matched[0] if matched else 'other', []).append(product)
         
         return {
             'categories': categories,
@@ -302,19 +359,8 @@ class AdvancedEcommerceScraper(EcommerceScraper):
             'target_audience_indicators': []
         }
         
-        # Simple keyword analysis
-        brand_keywords = {
-            'sustainability': ['sustainable', 'eco-friendly', 'environmental', 'green', 'organic', 'natural'],
-            'quality': ['premium', 'luxury', 'high-quality', 'craftsmanship', 'artisan'],
-            'innovation': ['innovative', 'technology', 'cutting-edge', 'advanced', 'revolutionary'],
-            'community': ['community', 'together', 'family', 'connect', 'share'],
-            'wellness': ['wellness', 'health', 'fitness', 'mindfulness', 'balance']
-        }
-        
-        text_lower = brand_text.lower()
-        for theme, keywords in brand_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                insights['key_themes'].append(theme)
+        # Simple keyword analysis in a single pass over the text
+        insights['key_themes'] = _matched_groups(self.BRAND_THEME_PATTERN, brand_text)
         
         return insights
     
@@ -331,23 +377,14 @@ class AdvancedEcommerceScraper(EcommerceScraper):
             return patterns
         
         # Topic analysis
-        topics = {
-            'shipping': ['ship', 'delivery', 'shipping'],
-            'returns': ['return', 'refund', 'exchange'],
-            'sizing': ['size', 'fit', 'sizing'],
-            'payment': ['payment', 'pay', 'credit card', 'paypal'],
-            'products': ['product', 'material', 'quality']
-        }
-        
         answer_lengths = []
         for faq in faqs:
-            question = faq.get('question', '').lower()
+            question = faq.get('question', '')
             answer = faq.get('answer', '')
             answer_lengths.append(len(answer))
             
-            for topic, keywords in topics.items():
-                if any(keyword in question for keyword in keywords):
-                    patterns['common_topics'][topic] = patterns['common_topics'].get(topic, 0) + 1
+            for topic in _matched_groups(self.FAQ_TOPIC_PATTERN, question):
+                patterns['common_topics'][topic] = patterns['common_topics'].get(topic, 0) + 1
         
         if answer_lengths:
             patterns['avg_answer_length'] = sum(answer_lengths) / len(answer_lengths)
@@ -1,22 +1,42 @@
+import hmac
 import os
 import time
 import logging
 import json
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+import click
+import orjson
+from flask import Flask, abort, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_migrate import Migrate
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import undefer
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from models import db, AnalysisHistory, CompetitorAnalysis, BulkProcessingJob
+from models import db, ensure_schema, utcnow, AnalysisHistory, CompetitorAnalysis, BulkProcessingJob
 from shopify_scraper import EcommerceScraper
 from advanced_scraper import AdvancedEcommerceScraper
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for jsonify and request.get_json."""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev_secret_key_12345")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
@@ -31,33 +51,68 @@ app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
+    "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+    "json_deserializer": orjson.loads,
+    # Multi-row inserts go out as batched INSERT ... VALUES of up to 1000 rows,
+    # and each engine keeps up to 500 compiled statements
+    "insertmanyvalues_page_size": 1000,
+    "query_cache_size": 500,
 }
 
+if database_url.startswith("sqlite:///"):
+    # SQLite allows one writer: keep a single write connection and serve plain
+    # SELECTs from a read-only pool (see RoutingSession in models.py)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        "pool_size": 1,
+        "max_overflow": 0,
+    })
+    app.config["SQLALCHEMY_BINDS"] = {
+        "reader": {
+            "url": "sqlite:///file:" + database_url[len("sqlite:///"):] + "?mode=ro&uri=true",
+            "pool_size": os.cpu_count() or 4,
+            "pool_recycle": 300,
+            "pool_pre_ping": True,
+            "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+            "json_deserializer": orjson.loads,
+            "query_cache_size": 500,
+        }
+    }
+
+# Configure cache for stored analyses and dashboard stats (Redis when available)
+redis_url = os.environ.get("REDIS_URL")
+app.config["CACHE_TYPE"] = "RedisCache" if redis_url else "SimpleCache"
+app.config["CACHE_REDIS_URL"] = redis_url
+app.config["CACHE_DEFAULT_TIMEOUT"] = 3600
+
+# Bearer token for /api/cache/clear; the route stays disabled while it is unset
+app.config["CACHE_CLEAR_TOKEN"] = os.environ.get("CACHE_CLEAR_TOKEN")
+
 # Initialize extensions
 db.init_app(app)
 migrate = Migrate(app, db)
+cache = Cache(app)
 
 # Initialize scrapers
 scraper = EcommerceScraper()
 advanced_scraper = AdvancedEcommerceScraper()
 
-# Create tables
+# Long-lived pool for bulk jobs, reused across requests
+BULK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='bulk-job')
+BULK_FLUSH_SIZE = 50  # rows per insert batch
+BULK_FLUSH_INTERVAL = 5  # seconds between progress commits
+
+# Create tables unless the schema fingerprint shows they're already current
 with app.app_context():
-    db.create_all()
+    ensure_schema()
 
 @app.route('/')
 def index():
     """Render the main page with the URL input form."""
     # Get recent analyses for dashboard
-    recent_analyses = AnalysisHistory.query.order_by(AnalysisHistory.created_at.desc()).limit(5).all()
+    recent_analyses = AnalysisHistory.list_rows(db.session, 5)
     
     # Get some statistics
-    stats = {
-        'total_analyses': AnalysisHistory.query.count(),
-        'successful_analyses': AnalysisHistory.query.filter_by(status='completed').count(),
-        'total_competitors_found': CompetitorAnalysis.query.count(),
-        'bulk_jobs': BulkProcessingJob.query.count()
-    }
+    stats = get_dashboard_stats()
     
     return render_template('index.html', recent_analyses=recent_analyses, stats=stats)
 
@@ -184,32 +239,8 @@ def bulk_analyze():
         db.session.add(job)
         db.session.commit()
         
-        # Process URLs in background (simplified for demo)
-        def process_bulk_job():
-            results = advanced_scraper.bulk_analyze_urls(urls, max_workers=2)
-            
-            # Save results
-            for result in results['successful']:
-                save_analysis_to_db(
-                    result['website_url'], 
-                    result, 
-                    'bulk', 
-                    'completed',
-                    results['processing_time'] / len(urls)
-                )
-            
-            # Update job status
-            job.completed_urls = len(results['successful'])
-            job.failed_urls = len(results['failed'])
-            job.status = 'completed'
-            job.completed_at = datetime.utcnow()
-            db.session.commit()
-        
-        # Start background processing (in production, use Celery or similar)
-        import threading
-        thread = threading.Thread(target=process_bulk_job)
-        thread.daemon = True
-        thread.start()
+        # Process URLs on the shared background pool (in production, use Celery or similar)
+        BULK_EXECUTOR.submit(process_bulk_job, job.id, urls)
         
         return jsonify({
             'job_id': job.id,
@@ -229,27 +260,35 @@ def get_job_status(job_id):
 
 @app.route('/history')
 def analysis_history():
-    """Show analysis history."""
-    page = request.args.get('page', 1, type=int)
-    per_page = 20
-    
-    analyses = AnalysisHistory.query.order_by(
-        AnalysisHistory.created_at.desc()
-    ).paginate(page=page, per_page=per_page, error_out=False)
-    
-    return render_template('history.html', analyses=analyses)
+    """Show analysis history, paginated with a (created_at, id) keyset cursor."""
+    analyses, next_cursor = get_history_page()
+    return render_template('history.html', analyses=analyses, next_cursor=next_cursor)
+
+@app.route('/api/history')
+def api_analysis_history():
+    """Get a page of analysis history as JSON."""
+    analyses, next_cursor = get_history_page()
+    payload = {'analyses': [dict(row) for row in analyses], 'next_cursor': next_cursor}
+    return app.response_class(orjson.dumps(payload), mimetype='application/json')
 
 @app.route('/analysis/<int:analysis_id>')
 def view_analysis(analysis_id):
     """View detailed analysis results."""
-    analysis = AnalysisHistory.query.get_or_404(analysis_id)
+    analysis = db.session.get(
+        AnalysisHistory, analysis_id,
+        options=[undefer(AnalysisHistory.analysis_data)]
+    )
+    if analysis is None:
+        abort(404)
     return render_template('analysis_detail.html', analysis=analysis)
 
 @app.route('/api/analysis/<int:analysis_id>')
 def get_analysis(analysis_id):
     """Get analysis data as JSON."""
-    analysis = AnalysisHistory.query.get_or_404(analysis_id)
-    return jsonify(analysis.to_dict())
+    analysis_data = get_analysis_data(analysis_id)
+    if analysis_data is None:
+        abort(404)
+    return jsonify(analysis_data)
 
 @app.route('/competitors/<int:analysis_id>')
 def view_competitors(analysis_id):
@@ -258,56 +297,178 @@ def view_competitors(analysis_id):
     competitors = CompetitorAnalysis.query.filter_by(analysis_id=analysis_id).all()
     return render_template('competitors.html', analysis=analysis, competitors=competitors)
 
+@app.route('/api/cache/clear', methods=['POST'])
+def clear_cache():
+    """Purge cached scraper results so the next analysis re-fetches each site.
+    
+    Requires "Authorization: Bearer <CACHE_CLEAR_TOKEN>". The cache lives in
+    each worker's memory, so this is an HTTP route rather than a CLI command.
+    """
+    token = app.config.get("CACHE_CLEAR_TOKEN")
+    if not token:
+        abort(404)
+    
+    supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return jsonify({
+            'error': 'Invalid or missing cache clear token',
+            'status_code': 403
+        }), 403
+    
+    cleared = scraper.clear_cache()
+    
+    return jsonify({
+        'message': 'Cache cleared',
+        'cleared_entries': cleared
+    })
+
+def analysis_metrics(insights):
+    """Derive the summary metric columns stored alongside an analysis payload."""
+    if insights.get('error'):
+        return {
+            'total_products': 0,
+            'has_social_handles': False,
+            'has_contact_info': False,
+            'has_policies': False
+        }
+    
+    product_catalog = insights.get('product_catalog') or {}
+    contact_details = insights.get('contact_details') or {}
+    return {
+        'total_products': product_catalog.get('total_count', 0),
+        'has_social_handles': bool(insights.get('social_handles')),
+        'has_contact_info': bool(contact_details.get('emails') or contact_details.get('phones')),
+        'has_policies': bool(insights.get('policies'))
+    }
+
+def build_analysis_row(website_url, insights, analysis_type='single', status='completed', processing_time=0, error_message=None):
+    """Build the AnalysisHistory column values for an analysis result."""
+    return {
+        'website_url': website_url,
+        'analysis_data': insights,
+        'analysis_type': analysis_type,
+        'status': status,
+        'processing_time': processing_time,
+        'error_message': error_message,
+        **analysis_metrics(insights)
+    }
+
+@app.cli.command('backfill-metrics')
+def backfill_metrics_command():
+    """Recompute the summary metric columns of every stored analysis."""
+    updated = AnalysisHistory.backfill_metrics(db.session, analysis_metrics)
+    click.echo(f"Updated metrics for {updated} analyses")
+
+@cache.memoize(timeout=30)
+def get_dashboard_stats():
+    """Count analyses, competitors and bulk jobs in a single round-trip."""
+    totals = db.session.query(
+        func.count(AnalysisHistory.id),
+        func.count(case((AnalysisHistory.status == 'completed', 1))),
+        db.session.query(func.count(CompetitorAnalysis.id)).scalar_subquery(),
+        db.session.query(func.count(BulkProcessingJob.id)).scalar_subquery()
+    ).one()
+    
+    return {
+        'total_analyses': totals[0],
+        'successful_analyses': totals[1],
+        'total_competitors_found': totals[2],
+        'bulk_jobs': totals[3]
+    }
+
+@cache.memoize()
+def get_analysis_data(analysis_id):
+    """Load a stored analysis as a dict; rows are never modified once saved."""
+    analysis = db.session.get(
+        AnalysisHistory, analysis_id,
+        options=[undefer(AnalysisHistory.analysis_data)]
+    )
+    return analysis.to_dict() if analysis else None
+
+def get_history_page(per_page=20):
+    """Read the keyset cursor from the request and return (rows, next_cursor)."""
+    before = request.args.get('before', type=datetime.fromisoformat)
+    before_id = request.args.get('before_id', type=int)
+    
+    # Fetch one extra row to know whether another page follows
+    analyses = AnalysisHistory.list_rows(db.session, per_page + 1, before, before_id)
+    
+    next_cursor = None
+    if len(analyses) > per_page:
+        analyses = analyses[:per_page]
+        next_cursor = {
+            'before': analyses[-1]['created_at'].isoformat(),
+            'before_id': analyses[-1]['id']
+        }
+    return analyses, next_cursor
+
+def flush_bulk_rows(rows):
+    """Insert buffered bulk results and commit them with the job's progress counters."""
+    if rows:
+        db.session.execute(insert(AnalysisHistory), rows)
+        rows.clear()
+    db.session.commit()
+
+def process_bulk_job(job_id, urls):
+    """Run a bulk analysis job in a background worker and record its results."""
+    with app.app_context():
+        job = db.session.get(BulkProcessingJob, job_id)
+        if job is None:
+            app.logger.error(f"Bulk job {job_id} not found")
+            return
+        
+        try:
+            # Persist results in chunks as they arrive instead of holding the whole job
+            rows = []
+            last_flush = time.monotonic()
+            for url, outcome, processing_time in advanced_scraper.iter_bulk_analyze(urls, max_workers=2):
+                if outcome.get('error'):
+                    job.failed_urls += 1
+                else:
+                    rows.append(build_analysis_row(
+                        outcome['website_url'], 
+                        outcome, 
+                        'bulk', 
+                        'completed',
+                        processing_time
+                    ))
+                    job.completed_urls += 1
+                
+                if len(rows) >= BULK_FLUSH_SIZE or time.monotonic() - last_flush >= BULK_FLUSH_INTERVAL:
+                    flush_bulk_rows(rows)
+                    last_flush = time.monotonic()
+            
+            flush_bulk_rows(rows)
+            
+            # Update job status
+            job.status = 'completed'
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Error processing bulk job {job_id}: {str(e)}")
+            job.status = 'failed'
+        
+        # Same database-side UTC clock as the model's created_at default
+        job.completed_at = utcnow()
+        db.session.commit()
+
 def save_analysis_to_db(website_url, insights, analysis_type='single', status='completed', processing_time=0, error_message=None):
     """Save analysis results to database."""
     try:
-        # Extract key metrics
-        total_products = 0
-        has_social_handles = False
-        has_contact_info = False
-        has_policies = False
-        
-        if not insights.get('error'):
-            product_catalog = insights.get('product_catalog', {})
-            total_products = product_catalog.get('total_count', 0)
-            has_social_handles = bool(insights.get('social_handles'))
-            has_contact_info = bool(insights.get('contact_details', {}).get('emails') or 
-                                  insights.get('contact_details', {}).get('phones'))
-            has_policies = bool(insights.get('policies'))
-        
-        analysis = AnalysisHistory(
-            website_url=website_url,
-            analysis_data=insights,
-            analysis_type=analysis_type,
-            status=status,
-            processing_time=processing_time,
-            error_message=error_message,
-            total_products=total_products,
-            has_social_handles=has_social_handles,
-            has_contact_info=has_contact_info,
-            has_policies=has_policies
+        # INSERT ... RETURNING hands back the id without building an ORM object
+        # or re-selecting the row after commit
+        analysis_id = db.session.scalar(
+            insert(AnalysisHistory).returning(AnalysisHistory.id),
+            build_analysis_row(website_url, insights, analysis_type, status, processing_time, error_message)
         )
         
-        db.session.add(analysis)
-        db.session.commit()
-        
         # Save competitor data if it's a competitive analysis
         if analysis_type == 'competitive' and not insights.get('error'):
-            competitors = insights.get('competitors', [])
-            for competitor in competitors:
-                if not competitor.get('error'):
-                    comp_analysis = CompetitorAnalysis(
-                        main_website=website_url,
-                        competitor_website=competitor.get('competitor_url', ''),
-                        analysis_id=analysis.id,
-                        competitor_data=competitor,
-                        similarity_score=competitor.get('similarity_score', 0)
-                    )
-                    db.session.add(comp_analysis)
-            
-            db.session.commit()
+            CompetitorAnalysis.bulk_create(
+                db.session, website_url, analysis_id, insights.get('competitors', [])
+            )
         
-        return analysis.id
+        db.session.commit()
+        return analysis_id
         
     except Exception as e:
         db.session.rollback()
@@ -3,34 +3,32 @@
 # Double-click this file or run: python local_app.py
 
 import os
-from app import app, db
 
-# Load environment variables from .env file
+# Load environment variables from .env file before app reads its config
 if os.path.exists('.env'):
-    with open('.env', 'r', encoding='utf-8') as f:
-        for line in f:
-            if '=' in line and not line.startswith('#'):
-                key, value = line.strip().split('=', 1)
-                os.environ[key] = value
+    try:
+        from dotenv import dotenv_values
+        env_values = dotenv_values('.env')
+    except ImportError:
+        with open('.env', 'r', encoding='utf-8') as f:
+            env_values = dict(
+                line.strip().split('=', 1) for line in f.read().splitlines()
+                if '=' in line and not line.startswith('#')
+            )
+    os.environ.update({key: value for key, value in env_values.items() if value is not None})
 
 # Override database for local development
 if not os.environ.get('DATABASE_URL'):
     os.environ['DATABASE_URL'] = 'sqlite:///local_shopify_insights.db'
 
+from app import app
+
 if __name__ == '__main__':
     print("🚀 Starting Shopify Insights Extractor...")
     print("📱 Open your browser to: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop the server")
     print("-" * 50)
     
-    # Create tables if they don't exist
-    with app.app_context():
-        try:
-            db.create_all()
-            print("✓ Database initialized")
-        except Exception as e:
-            print(f"Warning: Database setup issue: {e}")
-    
     # Run the application
     app.run(
         host='127.0.0.1',  # Localhost for Windows
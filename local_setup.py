@@ -5,9 +5,28 @@ Run this to set up the application for local Windows development
 """
 
 import os
+import re
 import sys
 import subprocess
 
+# Persistent wheel cache so re-running setup doesn't download everything again
+PIP_CACHE_DIR = os.path.expanduser('~/.cache/pip-deepsolv')
+
+def normalize_requirement(requirement):
+    """Normalize a name==version pin so pip's spellings compare equal."""
+    name, _, version = requirement.partition('==')
+    return re.sub(r'[-_.]+', '-', name).lower() + '==' + version.strip()
+
+def installed_packages():
+    """Return the normalized name==version pins already installed."""
+    try:
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'pip', 'list', '--format=freeze'], text=True
+        )
+    except subprocess.CalledProcessError:
+        return set()
+    return {normalize_requirement(line) for line in output.splitlines() if '==' in line}
+
 def install_dependencies():
     """Install required dependencies."""
     dependencies = [
@@ -21,13 +40,36 @@ def install_dependencies():
         'gunicorn==23.0.0',
         'trafilatura==2.0.0',
         'openai==1.99.9',
-        'email-validator==2.2.0'
+        'email-validator==2.2.0',
+        'aiohttp==3.12.15',
+        'cachetools==6.1.0',
+        'orjson==3.11.1',
+        'Flask-Caching==2.3.1',
+        'zstandard==0.23.0',
+        'soupsieve==2.7',
+        'brotli==1.1.0'
     ]
     
+    installed = installed_packages()
+    dependencies = [dep for dep in dependencies if normalize_requirement(dep) not in installed]
+    if not dependencies:
+        print("✓ All dependencies already installed")
+        return
+    
     print("Installing dependencies...")
+    pip_install = [sys.executable, '-m', 'pip', 'install', '--prefer-binary', '--cache-dir', PIP_CACHE_DIR]
+    subprocess.call(pip_install + ['--upgrade', 'pip', 'wheel'])
+    try:
+        # One pip run resolves the whole set together and downloads in parallel
+        subprocess.check_call(pip_install + dependencies)
+        print(f"✓ Installed {len(dependencies)} packages")
+        return
+    except subprocess.CalledProcessError:
+        print("✗ Batch install failed, retrying packages one at a time...")
+    
     for dep in dependencies:
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', dep])
+            subprocess.check_call(pip_install + [dep])
             print(f"✓ Installed {dep}")
         except subprocess.CalledProcessError:
             print(f"✗ Failed to install {dep}")
@@ -42,6 +84,8 @@ SESSION_SECRET=local_dev_secret_key_12345
 DATABASE_URL=sqlite:///local_shopify_insights.db
 FLASK_ENV=development
 FLASK_DEBUG=1
+# Set to enable POST /api/cache/clear (sent as a Bearer token)
+# CACHE_CLEAR_TOKEN=
 """
     
     with open('.env', 'w', encoding='utf-8') as f:
@@ -55,34 +99,32 @@ def create_local_app():
 # Double-click this file or run: python local_app.py
 
 import os
-from app import app, db
 
-# Load environment variables from .env file
+# Load environment variables from .env file before app reads its config
 if os.path.exists('.env'):
-    with open('.env', 'r', encoding='utf-8') as f:
-        for line in f:
-            if '=' in line and not line.startswith('#'):
-                key, value = line.strip().split('=', 1)
-                os.environ[key] = value
+    try:
+        from dotenv import dotenv_values
+        env_values = dotenv_values('.env')
+    except ImportError:
+        with open('.env', 'r', encoding='utf-8') as f:
+            env_values = dict(
+                line.strip().split('=', 1) for line in f.read().splitlines()
+                if '=' in line and not line.startswith('#')
+            )
+    os.environ.update({key: value for key, value in env_values.items() if value is not None})
 
 # Override database for local development
 if not os.environ.get('DATABASE_URL'):
     os.environ['DATABASE_URL'] = 'sqlite:///local_shopify_insights.db'
 
+from app import app
+
 if __name__ == '__main__':
     print("🚀 Starting Shopify Insights Extractor...")
     print("📱 Open your browser to: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop the server")
     print("-" * 50)
     
-    # Create tables if they don't exist
-    with app.app_context():
-        try:
-            db.create_all()
-            print("✓ Database initialized")
-        except Exception as e:
-            print(f"Warning: Database setup issue: {e}")
-    
     # Run the application
     app.run(
         host='127.0.0.1',  # Localhost for Windows
@@ -0,0 +1,89 @@
+"""Store JSON payload columns as binary for CompressedJSON
+
+Revision ID: 3f1a9c2d7b40
+Revises:
+Create Date: 2026-10-15 21:40:00.000000
+
+Tables are created by ensure_schema() at startup, so this first revision
+only converts columns of databases created before CompressedJSON.
+
+PostgreSQL rejects bytes written to a json column, so the existing json/jsonb
+payload columns (analysis_data, competitor_data) become bytea holding the
+UTF-8 JSON text. CompressedJSON reads those rows as before. SQLite stores
+blobs in a JSON-declared column as-is and needs no change.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2d7b40'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs typed CompressedJSON on the models
+PAYLOAD_COLUMNS = [
+    ('analysis_history', 'analysis_data'),
+    ('competitor_analysis', 'competitor_data'),
+]
+
+# Every zstd frame starts with this magic number; JSON text never does
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _column_type(bind, table, column):
+    inspector = sa.inspect(bind)
+    if not inspector.has_table(table):
+        return None
+    for info in inspector.get_columns(table):
+        if info['name'] == column:
+            return info['type']
+    return None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table, column in PAYLOAD_COLUMNS:
+        column_type = _column_type(bind, table, column)
+        if column_type is None or isinstance(column_type, sa.LargeBinary):
+            continue  # Missing, or already created as bytea by ensure_schema
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE bytea USING convert_to({column}::text, 'UTF8')"
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    decompressor = zstandard.ZstdDecompressor()
+    for table, column in PAYLOAD_COLUMNS:
+        column_type = _column_type(bind, table, column)
+        if column_type is None or not isinstance(column_type, sa.LargeBinary):
+            continue
+
+        # json can only hold text: inflate zstd-compressed rows back to plain JSON first
+        payloads = sa.table(table, sa.column('id', sa.Integer), sa.column(column, sa.LargeBinary))
+        compressed = bind.execute(
+            sa.select(payloads.c.id, payloads.c[column])
+            .where(sa.func.substring(payloads.c[column], 1, 4) == ZSTD_MAGIC)
+        ).all()
+        for row_id, data in compressed:
+            bind.execute(
+                payloads.update()
+                .where(payloads.c.id == row_id)
+                .values({column: decompressor.decompress(bytes(data))})
+            )
+
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE json USING convert_from({column}, 'UTF8')::json"
+        )
@@ -0,0 +1,56 @@
+"""Replace single-column URL indexes with composite listing indexes
+
+Revision ID: 8b2e4d6a1c93
+Revises: 3f1a9c2d7b40
+Create Date: 2026-10-15 21:50:00.000000
+
+ensure_schema() creates the composite indexes at startup, so each step
+checks what already exists. The single-column website_url and main_website
+indexes are dropped because the composites lead with those columns.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6a1c93'
+down_revision = '3f1a9c2d7b40'
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns) declared in the models' __table_args__
+COMPOSITE_INDEXES = [
+    ('analysis_history', 'ix_ah_url_created', ['website_url', 'created_at']),
+    ('analysis_history', 'ix_ah_status_type_created', ['status', 'analysis_type', 'created_at']),
+    ('competitor_analysis', 'ix_comp_main_created', ['main_website', 'created_at']),
+    ('competitor_analysis', 'ix_comp_analysis', ['analysis_id']),
+]
+
+# Indexes created by index=True before the composites replaced them
+SUPERSEDED_INDEXES = [
+    ('analysis_history', 'ix_analysis_history_website_url', ['website_url']),
+    ('competitor_analysis', 'ix_competitor_analysis_main_website', ['main_website']),
+]
+
+
+def _index_names(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    for table, name, columns in COMPOSITE_INDEXES:
+        if name not in _index_names(table):
+            op.create_index(name, table, columns)
+    for table, name, columns in SUPERSEDED_INDEXES:
+        if name in _index_names(table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    for table, name, columns in SUPERSEDED_INDEXES:
+        if name not in _index_names(table):
+            op.create_index(name, table, columns)
+    for table, name, columns in COMPOSITE_INDEXES:
+        if name in _index_names(table):
+            op.drop_index(name, table_name=table)
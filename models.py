@@ -1,25 +1,133 @@
+import hashlib
 import os
-from datetime import datetime
+import sqlite3
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import JSON
+from flask_sqlalchemy.session import Session
+from sqlalchemy.orm import DeclarativeBase, column_property, deferred
+from sqlalchemy import Column, DateTime, LargeBinary, MetaData, String, Table, and_, case, delete, event, insert, lambda_stmt, or_, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import TypeDecorator
 import json
+import orjson
+import zstandard
+
+# Every zstd frame starts with this magic number; JSON text never does
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as orjson bytes, zstd-compressed once it passes a size threshold.
+    
+    Also reads values written by the plain JSON column type (text, or objects
+    already decoded by the driver) so existing rows stay readable.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    COMPRESS_THRESHOLD = 16 * 1024
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = orjson.dumps(value)
+        if len(data) < self.COMPRESS_THRESHOLD:
+            return data
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    
+    def result_processor(self, dialect, coltype):
+        # Skip LargeBinary's bytes() coercion so legacy text/JSON values get through
+        def process(value):
+            return self.process_result_value(value, dialect)
+        return process
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, (dict, list)):
+            return value
+        if isinstance(value, str):
+            return orjson.loads(value)
+        data = bytes(value)
+        if data[:4] == ZSTD_MAGIC:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return orjson.loads(data)
+
+class utcnow(FunctionElement):
+    """Current UTC time computed by the database, in the format SQLAlchemy reads back."""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, 'postgresql')
+def pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+@compiles(utcnow, 'sqlite')
+def sqlite_utcnow(element, compiler, **kw):
+    # Match SQLAlchemy's stored text format (microseconds) so comparisons against
+    # bound datetimes sort correctly; plain CURRENT_TIMESTAMP has no fraction
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
 
 class Base(DeclarativeBase):
     pass
 
-db = SQLAlchemy(model_class=Base)
+class RoutingSession(Session):
+    """Session that sends plain SELECTs to the read-only 'reader' bind when configured.
+    
+    Once a transaction has touched the writer, its reads stay there too so
+    they see the uncommitted writes.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and getattr(clause, 'is_select', False) and not self.info.get('uses_writer'):
+            reader = db.engines.get('reader')
+            if reader is not None:
+                return reader
+        self.info['uses_writer'] = True
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def reset_writer_routing(session, transaction):
+    if transaction.parent is None:
+        session.info.pop('uses_writer', None)
+
+db = SQLAlchemy(model_class=Base, session_options={'class_': RoutingSession})
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling and relaxed syncing so SQLite readers don't block on writes."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA cache_size=-20000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA foreign_keys=ON;
+    """)
+    cursor.close()
 
 class AnalysisHistory(db.Model):
     __tablename__ = 'analysis_history'
+    __table_args__ = (
+        db.Index('ix_ah_url_created', 'website_url', 'created_at'),
+        db.Index('ix_ah_status_type_created', 'status', 'analysis_type', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    website_url = db.Column(db.String(500), nullable=False, index=True)
-    analysis_data = db.Column(JSON, nullable=False)
+    website_url = db.Column(db.String(500), nullable=False)
+    # Deferred so rows loaded for listings don't carry the decoded payload;
+    # load it with undefer(AnalysisHistory.analysis_data) where it is read
+    analysis_data = deferred(db.Column(CompressedJSON, nullable=False))
     analysis_type = db.Column(db.String(50), default='single')  # 'single', 'bulk', 'competitor'
     status = db.Column(db.String(20), default='completed')  # 'completed', 'failed', 'in_progress'
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow(), server_default=utcnow(), index=True)
+    updated_at = db.Column(db.DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     processing_time = db.Column(db.Float)  # in seconds
     error_message = db.Column(db.Text)
     
@@ -29,9 +137,62 @@ class AnalysisHistory(db.Model):
     has_contact_info = db.Column(db.Boolean, default=False)
     has_policies = db.Column(db.Boolean, default=False)
     
+    # Columns returned by list_rows; analysis_data is left out on purpose
+    LIST_COLUMNS = (
+        'id', 'website_url', 'analysis_type', 'status', 'created_at',
+        'processing_time', 'error_message', 'total_products',
+        'has_social_handles', 'has_contact_info', 'has_policies'
+    )
+    
     def __repr__(self):
         return f'<AnalysisHistory {self.id}: {self.website_url}>'
     
+    @classmethod
+    def list_rows(cls, session, limit, before=None, before_id=None):
+        """Return summary rows newest first as plain mappings, skipping the ORM layer.
+        
+        before/before_id continue from a (created_at, id) keyset cursor.
+        """
+        # lambda_stmt caches the constructed statement and its compiled SQL by the
+        # lambdas' code; limit and cursor values become bound parameters
+        table = cls.__table__
+        columns = [table.c[name] for name in cls.LIST_COLUMNS]
+        stmt = lambda_stmt(lambda: select(*columns).order_by(table.c.created_at.desc(), table.c.id.desc()))
+        if before is not None and before_id is not None:
+            stmt += lambda s: s.where(or_(
+                table.c.created_at < before,
+                and_(table.c.created_at == before, table.c.id < before_id)
+            ))
+        elif before is not None:
+            stmt += lambda s: s.where(table.c.created_at < before)
+        stmt += lambda s: s.limit(limit)
+        return session.execute(stmt).mappings().all()
+    
+    @classmethod
+    def backfill_metrics(cls, session, derive, batch_size=500):
+        """Recompute the summary metric columns from analysis_data for every row.
+        
+        derive maps a decoded payload to a dict of metric columns. Rows are
+        read in id order batch_size at a time and written back with one
+        executemany UPDATE per batch. Returns the number of rows updated.
+        """
+        table = cls.__table__
+        updated = 0
+        last_id = 0
+        while True:
+            batch = session.execute(
+                select(table.c.id, table.c.analysis_data)
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                return updated
+            session.execute(update(cls), [{'id': row.id, **derive(row.analysis_data)} for row in batch])
+            session.commit()
+            updated += len(batch)
+            last_id = batch[-1].id
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -51,20 +212,42 @@ class AnalysisHistory(db.Model):
 
 class CompetitorAnalysis(db.Model):
     __tablename__ = 'competitor_analysis'
+    __table_args__ = (
+        db.Index('ix_comp_main_created', 'main_website', 'created_at'),
+        db.Index('ix_comp_analysis', 'analysis_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    main_website = db.Column(db.String(500), nullable=False, index=True)
+    main_website = db.Column(db.String(500), nullable=False)
     competitor_website = db.Column(db.String(500), nullable=False, index=True)
     analysis_id = db.Column(db.Integer, db.ForeignKey('analysis_history.id'), nullable=False)
-    competitor_data = db.Column(JSON, nullable=False)
+    competitor_data = db.Column(CompressedJSON, nullable=False)
     similarity_score = db.Column(db.Float)  # 0-1 similarity score
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow(), server_default=utcnow())
     
     # Relationship
     analysis = db.relationship('AnalysisHistory', backref='competitors')
     
     def __repr__(self):
         return f'<CompetitorAnalysis {self.id}: {self.main_website} vs {self.competitor_website}>'
+    
+    @classmethod
+    def bulk_create(cls, session, main_website, analysis_id, competitors):
+        """Insert a row for every successfully analyzed competitor in one statement."""
+        values = [
+            {
+                'main_website': main_website,
+                'competitor_website': competitor.get('competitor_url', ''),
+                'analysis_id': analysis_id,
+                'competitor_data': competitor,
+                'similarity_score': competitor.get('similarity_score', 0)
+            }
+            for competitor in competitors
+            if not competitor.get('error')
+        ]
+        if values:
+            session.execute(insert(cls), values)
+        return len(values)
 
 class BulkProcessingJob(db.Model):
     __tablename__ = 'bulk_processing_jobs'
@@ -75,9 +258,14 @@ class BulkProcessingJob(db.Model):
     completed_urls = db.Column(db.Integer, default=0)
     failed_urls = db.Column(db.Integer, default=0)
     status = db.Column(db.String(20), default='in_progress')  # 'in_progress', 'completed', 'failed'
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow(), server_default=utcnow())
     completed_at = db.Column(db.DateTime)
     
+    # Computed by the SELECT that loads the job, not in Python; needs no schema change
+    progress_percentage = column_property(
+        case((total_urls > 0, (completed_urls + failed_urls) * 100.0 / total_urls), else_=0.0)
+    )
+    
     def __repr__(self):
         return f'<BulkProcessingJob {self.id}: {self.job_name}>'
     
@@ -89,7 +277,55 @@ class BulkProcessingJob(db.Model):
             'completed_urls': self.completed_urls,
             'failed_urls': self.failed_urls,
             'status': self.status,
-            'progress_percentage': (self.completed_urls + self.failed_urls) / self.total_urls * 100 if self.total_urls > 0 else 0,
+            'progress_percentage': self.progress_percentage,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None
-        }
\ No newline at end of file
+        }
+
+# Kept outside db.metadata so it never changes the fingerprint it stores
+schema_meta = Table(
+    '_schema_meta', MetaData(),
+    Column('key', String(50), primary_key=True),
+    Column('value', String(64))
+)
+
+# Part of the fingerprint; bump it when ensure_schema learns a new reconcile step
+# so databases stamped by an older version are reconciled again
+SCHEMA_RECONCILE_VERSION = 2
+
+def schema_fingerprint():
+    """Hash the table, column and index names declared on the models."""
+    tables = sorted(
+        (table.name, sorted(c.name for c in table.columns), sorted(i.name for i in table.indexes))
+        for table in db.metadata.sorted_tables
+    )
+    payload = repr((SCHEMA_RECONCILE_VERSION, tables)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def ensure_schema():
+    """Create missing tables and indexes when the stored schema fingerprint is missing or stale.
+    
+    Returns True if the schema was reconciled. create_all skips tables that
+    already exist, indexes included, so every declared index is also created
+    with checkfirst; the fingerprint is only stored once all of that has
+    succeeded. Column type changes still need `flask db upgrade`.
+    """
+    fingerprint = schema_fingerprint()
+    query = select(schema_meta.c.value).where(schema_meta.c.key == 'fingerprint')
+    try:
+        with db.engine.connect() as conn:
+            stored = conn.execute(query).scalar()
+    except DBAPIError:
+        stored = None  # First run: the meta table doesn't exist yet
+    if stored == fingerprint:
+        return False
+    
+    with db.engine.begin() as conn:
+        db.metadata.create_all(conn)
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        schema_meta.create(conn, checkfirst=True)
+        conn.execute(delete(schema_meta).where(schema_meta.c.key == 'fingerprint'))
+        conn.execute(insert(schema_meta).values(key='fingerprint', value=fingerprint))
+    return True
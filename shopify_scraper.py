@@ -1,18 +1,283 @@
+import asyncio
+import contextvars
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import json
+import orjson
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import re
 import time
+from dataclasses import dataclass, field
+from itertools import accumulate
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Any, Tuple, TypeVar, Union
 import logging
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime; only the async fetch path needs it
+    import aiohttp
+
+T = TypeVar('T')
+
+
+# Parser used for every page; lxml is the C-backed one
+HTML_PARSER = 'lxml'
+
+
+@dataclass
+class FetchedPage:
+    """Minimal stand-in for requests.Response built from an aiohttp fetch.
+    
+    Also memoizes the parsed tree, its text and the decoded JSON body, so
+    extractors reading the same page share one parse. The tree is shared
+    between threads: don't modify it.
+    """
+    url: str
+    status_code: int
+    content: bytes
+    _soup: Optional[BeautifulSoup] = field(default=None, init=False, repr=False, compare=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _lower_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _json: Any = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def json(self):
+        with self._lock:
+            if self._json is None:
+                self._json = orjson.loads(self.content)
+            return self._json
+
+    def close(self):
+        pass
+
+    def soup(self) -> BeautifulSoup:
+        with self._lock:
+            if self._soup is None:
+                self._soup = BeautifulSoup(self.content, HTML_PARSER)
+            return self._soup
+
+    def text(self) -> str:
+        soup = self.soup()
+        with self._lock:
+            if self._text is None:
+                self._text = soup.get_text()
+            return self._text
+
+    def lower_text(self) -> str:
+        text = self.text()
+        with self._lock:
+            if self._lower_text is None:
+                self._lower_text = text.lower()
+            return self._lower_text
+
+
+# Pages already fetched for the site being extracted: the homepage, plus the
+# /products.json pages on the async path. make_request serves them without a request.
+_prefetched_pages: contextvars.ContextVar[Optional[Dict[str, Optional[FetchedPage]]]] = \
+    contextvars.ContextVar('prefetched_pages', default=None)
+
+
+# Currency markers searched for in lowercased page text, in priority order. They
+# are plain substrings, so `in` checks replace a regex scan per marker.
+_CURRENCY_MARKERS = {
+    'USD': ('$', 'usd', 'dollar', 'united states'),
+    'EUR': ('€', 'eur', 'euro'),
+    'GBP': ('£', 'gbp', 'pound', 'sterling'),
+    'INR': ('₹', 'inr', 'rupee', 'rs.', 'rs ', 'india'),
+    'CAD': ('cad', 'c$', 'canada'),
+    'AUD': ('aud', 'a$', 'australia'),
+    'JPY': ('¥', 'jpy', 'yen', 'japan'),
+    'CNY': ('¥', 'cny', 'yuan', 'china'),
+    'KRW': ('₩', 'krw', 'won', 'korea'),
+    'THB': ('฿', 'thb', 'baht', 'thailand'),
+    'SGD': ('sgd', 's$', 'singapore'),
+    'MYR': ('myr', 'rm', 'malaysia'),
+    'PHP': ('₱', 'php', 'peso', 'philippines'),
+    'VND': ('₫', 'vnd', 'dong', 'vietnam'),
+    'BRL': ('r$', 'brl', 'real', 'brazil'),
+    'MXN': ('mxn', 'peso', 'mexico'),
+    'ZAR': ('zar', 'rand', 'south africa')
+}
+
+# Platforms recognised by name alone, checked after the Shopify and WooCommerce
+# markup probes
+_PLATFORM_MARKERS = ('magento', 'bigcommerce', 'prestashop', 'opencart')
+
+# Extractor regexes, compiled once at import instead of on every call
+_PRICE_RE = re.compile(r'[\$£€₹¥₩฿₱₫]?[\d,.]+(\.[\d]{2})?')
+_PRICE_TEXT_RE = re.compile(r'[\$£€₹¥₩฿₱₫][\d,.]+(\.[\d]{2})?')
+
+_WOOCOMMERCE_CLASS_RE = re.compile(r'woocommerce')
+_TITLE_CLASS_RE = re.compile(r'title|name')
+_PRICE_CLASS_RE = re.compile(r'price|cost|amount')
+_QUESTION_CLASS_RE = re.compile(r'question|q\b')
+_ANSWER_CLASS_RE = re.compile(r'answer|a\b')
+
+# The contact page is only searched for address blocks. Any element whose class
+# mentions "address" is kept with its subtree; the rest of the page is skipped
+_ADDRESS_STRAINER = SoupStrainer(class_=re.compile(r'address'))
+
+# CSS selectors, compiled once instead of being looked up on every select call
+_PRODUCT_SIEVES = tuple(sv.compile(selector) for selector in (
+    '.product-item', '.product-card', '.product',
+    '[class*="product"]', '[data-product]',
+    '.woocommerce-LoopProduct-link', '.product-wrap',
+    '.grid-product', '.product-grid-item',
+    '.item-product', '.product-list-item'
+))
+_TITLE_SIEVES = tuple(sv.compile(selector) for selector in (
+    'h1', 'h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]', 'a'
+))
+_PRICE_SIEVES = tuple(sv.compile(selector) for selector in (
+    '[class*="price"]', '[class*="cost"]', '[class*="amount"]',
+    '.money', '.currency', '[data-price]'
+))
+_DESC_SIEVES = tuple(sv.compile(selector) for selector in ('.description', '.summary', '[class*="desc"]'))
+_IMG_SIEVE = sv.compile('img')
+_LINK_SIEVE = sv.compile('a')
+_HERO_SIEVES = tuple(sv.compile(selector) for selector in (
+    '.hero-product',
+    '.featured-product',
+    '.product-card',
+    '.product-item',
+    '[class*="hero"]',
+    '[class*="featured"]',
+    '.slider .product',
+    '.carousel .product'
+))
+_SOCIAL_LINK_SIEVE = sv.compile('a[href], link[rel~="me"][href]')
+_FAQ_SIEVES = tuple(sv.compile(selector) for selector in (
+    '.faq-item',
+    '.question',
+    '.accordion-item',
+    '[class*="faq"]',
+    '.qa-pair'
+))
+
+_SOCIAL_PATTERNS = {
+    platform: [re.compile(pattern) for pattern in patterns]
+    for platform, patterns in {
+        'instagram': [r'instagram\.com/([^/\s"\']+)', r'@([a-zA-Z0-9_.]+)'],
+        'facebook': [r'facebook\.com/([^/\s"\']+)', r'fb\.com/([^/\s"\']+)'],
+        'twitter': [r'twitter\.com/([^/\s"\']+)', r'x\.com/([^/\s"\']+)'],
+        'tiktok': [r'tiktok\.com/@([^/\s"\']+)'],
+        'youtube': [r'youtube\.com/(?:channel/|user/|c/)?([^/\s"\']+)'],
+        'linkedin': [r'linkedin\.com/(?:company/|in/)?([^/\s"\']+)'],
+        'pinterest': [r'pinterest\.com/([^/\s"\']+)']
+    }.items()
+}
+
+# Emails and phone numbers in one sweep; lastgroup says which one matched
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>(?:\+\d{1,3}[-.\s]?)?(?:\d{10,}|\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}))'
+)
+
+# One alternation per link type: a link qualifies if any of its patterns match
+_LINK_PATTERNS = {
+    link_type: re.compile('|'.join(patterns), re.IGNORECASE)
+    for link_type, patterns in {
+        'order_tracking': [r'track', r'order.*track', r'track.*order'],
+        'contact_us': [r'contact', r'contact.*us'],
+        'blog': [r'blog', r'news', r'articles'],
+        'support': [r'support', r'help', r'customer.*service'],
+        'store_locator': [r'store.*locat', r'find.*store', r'locations'],
+        'size_guide': [r'size.*guide', r'sizing', r'fit.*guide']
+    }.items()
+}
+
+
+class HostRateLimiter:
+    """Per-host token bucket; different hosts never wait on each other.
+    
+    Each host may send `burst` requests back to back, then one more every
+    min_interval seconds. Rather than counting tokens, each host keeps the time
+    its bucket would be full again, so a request only waits for the deficit.
+    """
+    
+    def __init__(self, requests_per_second: float = 5.0, burst: int = 5):
+        self.min_interval = 1.0 / requests_per_second
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._full_at: Dict[str, float] = {}
+    
+    def _reserve(self, url: str) -> float:
+        """Take a token from the host's bucket and return the seconds until it is available."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            full_at = max(now, self._full_at.get(host, now)) + self.min_interval
+            self._full_at[host] = full_at
+        return full_at - self.burst * self.min_interval - now
+    
+    def wait(self, url: str):
+        """Block the calling thread until a request to url's host may be sent."""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self, url: str):
+        """Suspend the calling coroutine until a request to url's host may be sent."""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class EcommerceScraper:
+    # Candidate paths probed by the page extractors
+    POLICY_PATHS = {
+        'privacy_policy': ['/pages/privacy-policy', '/privacy-policy', '/privacy'],
+        'return_policy': ['/pages/return-policy', '/return-policy', '/returns', '/pages/returns'],
+        'refund_policy': ['/pages/refund-policy', '/refund-policy', '/refunds', '/pages/refunds'],
+        'terms_of_service': ['/pages/terms-of-service', '/terms-of-service', '/terms', '/pages/terms'],
+        'shipping_policy': ['/pages/shipping-policy', '/shipping-policy', '/shipping', '/pages/shipping']
+    }
+    FAQ_PATHS = ['/pages/faq', '/faq', '/pages/frequently-asked-questions', '/help']
+    CONTACT_PATHS = ['/pages/contact', '/contact', '/contact-us', '/pages/contact-us']
+    ABOUT_PATHS = ['/pages/about', '/about', '/pages/about-us', '/about-us', '/pages/our-story', '/our-story']
+    
+    # Successful extractions shared by all scraper instances, keyed by normalized URL
+    cache = TTLCache(maxsize=512, ttl=3600)
+    _cache_lock = threading.Lock()
+    
+    # Whether each host serves Shopify's /products.json, keyed by netloc
+    _shopify_hosts = LRUCache(maxsize=1024)
+    
+    # Per-host politeness shared by every scraper instance and both fetch paths
+    rate_limiter = HostRateLimiter(requests_per_second=5)
+    
+    # Shopify serves at most 250 products per /products.json page
+    SHOPIFY_PAGE_SIZE = 250
+    SHOPIFY_MAX_PAGES = 20
+    
+    # HTML pages are read up to this many decoded bytes; the rest is dropped
+    MAX_PAGE_BYTES = 5 * 1024 * 1024
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        
+        # Keep-alive connection pool shared by every request this scraper makes
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.logger = logging.getLogger(__name__)
     
     def _process_tags(self, tags):
@@ -39,44 +304,145 @@ class EcommerceScraper:
         
         return url
 
-    def make_request(self, url: str, timeout: int = 10) -> Optional[requests.Response]:
+    def make_request(self, url: str, timeout: Tuple[int, int] = (5, 30), stream: bool = False) -> Optional[Union[requests.Response, FetchedPage]]:
         """Make HTTP request with error handling."""
+        pages = _prefetched_pages.get()
+        if pages is not None and url in pages:
+            return pages[url]
+        
         try:
-            response = self.session.get(url, timeout=timeout)
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, timeout=timeout, stream=stream)
             return response
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request failed for {url}: {str(e)}")
             return None
 
+    def is_shopify(self, base_url: str) -> bool:
+        """Check whether a site is a Shopify store, probing /products.json once per host.
+        
+        Returns True when the answer is unknown so callers never skip pages
+        because of a transient failure.
+        """
+        netloc = urlparse(base_url).netloc.lower()
+        with self._cache_lock:
+            cached = self._shopify_hosts.get(netloc)
+        if cached is not None:
+            return cached
+        
+        # The async path has fetched the first products page already; a failed
+        # fetch leaves the answer unknown rather than probing again
+        products_url = self._products_page_url(base_url, 1)
+        pages = _prefetched_pages.get()
+        if pages is not None and products_url in pages:
+            if pages[products_url] is None:
+                return True
+            status_code = pages[products_url].status_code
+        else:
+            try:
+                self.rate_limiter.wait(base_url)
+                response = self.session.head(urljoin(base_url, '/products.json?limit=1'), allow_redirects=True, timeout=5)
+                status_code = response.status_code
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Shopify probe failed for {base_url}: {str(e)}")
+                return True
+        
+        if status_code not in (200, 404):
+            return True
+        
+        with self._cache_lock:
+            self._shopify_hosts[netloc] = status_code == 200
+        return status_code == 200
+
+    def _site_paths(self, base_url: str, paths: List[str]) -> List[str]:
+        """Drop Shopify-only /pages/ paths for sites that are not Shopify stores."""
+        if self.is_shopify(base_url):
+            return paths
+        return [path for path in paths if not path.startswith('/pages/')]
+
+    def _existing_urls(self, base_url: str, paths: List[str]) -> Iterator[str]:
+        """Yield the candidate page URLs that may exist, probing each with HEAD.
+        
+        Probes run lazily, so callers that stop at the first usable page skip
+        the rest. A 404 costs headers only instead of a full themed error page.
+        Servers that reject HEAD or fail the probe get the benefit of the doubt
+        and are left for the GET to decide.
+        """
+        for url_path in self._site_paths(base_url, paths):
+            full_url = urljoin(base_url, url_path)
+            try:
+                self.rate_limiter.wait(full_url)
+                status_code = self.session.head(full_url, allow_redirects=True, timeout=5).status_code
+            except requests.exceptions.RequestException as e:
+                self.logger.debug(f"HEAD probe failed for {full_url}: {str(e)}")
+                status_code = None
+            
+            if self._worth_fetching(status_code):
+                yield full_url
+    
+    @staticmethod
+    def _worth_fetching(status_code: Optional[int]) -> bool:
+        """Whether a HEAD probe's status (None if it failed) leaves the page worth a GET."""
+        return status_code is None or status_code < 400 or status_code in (405, 501)
+    
+    def _first_usable(self, base_url: str, paths: List[str], parse: Callable[[FetchedPage], Optional[T]]) -> Optional[T]:
+        """Parse the candidate pages in order and return the first result that isn't None."""
+        for full_url in self._existing_urls(base_url, paths):
+            page = self._get_page(full_url)
+            if page is not None:
+                result = parse(page)
+                if result is not None:
+                    return result
+        return None
+
+    def _products_page_url(self, base_url: str, page: int) -> str:
+        """URL of one full-size page of a Shopify store's /products.json."""
+        return urljoin(base_url, f'/products.json?limit={self.SHOPIFY_PAGE_SIZE}&page={page}')
+
+    def _read_products(self, response: Union[requests.Response, FetchedPage]) -> List[Dict[str, Any]]:
+        """Decode one /products.json page with orjson; pagination keeps each page small."""
+        if isinstance(response, FetchedPage):
+            data = response.json()
+        else:
+            with response:
+                data = orjson.loads(response.content)
+        
+        products = data.get('products') if isinstance(data, dict) else None
+        return products if isinstance(products, list) else []
+
+    def _soup(self, content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a page into a private tree the caller may modify."""
+        return BeautifulSoup(content, HTML_PARSER, parse_only=parse_only)
+
+    def _get_page(self, url: str) -> Optional[FetchedPage]:
+        """Fetch url as a FetchedPage that parses at most once, or None unless it returned 200.
+        
+        The body is streamed and decompressed straight into one buffer capped at
+        MAX_PAGE_BYTES, so an oversized page can't exhaust memory.
+        """
+        response = self.make_request(url, stream=True)
+        if isinstance(response, FetchedPage):
+            return response if response.status_code == 200 else None
+        if response is None:
+            return None
+        
+        with response:
+            if response.status_code != 200:
+                return None
+            try:
+                content = response.raw.read(self.MAX_PAGE_BYTES, decode_content=True)
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                self.logger.error(f"Reading body failed for {url}: {str(e)}")
+                return None
+        return FetchedPage(url=url, status_code=response.status_code, content=content)
+
     def detect_currency(self, base_url: str) -> str:
         """Detect the currency used on the website."""
-        response = self.make_request(base_url)
-        if not response or response.status_code != 200:
+        page = self._get_page(base_url)
+        if page is None:
             return 'USD'  # Default fallback
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        page_text = soup.get_text().lower()
-        
-        # Currency symbols and patterns
-        currency_patterns = {
-            'USD': [r'\$', r'usd', r'dollar', 'united states'],
-            'EUR': [r'€', r'eur', r'euro'],
-            'GBP': [r'£', r'gbp', r'pound', r'sterling'],
-            'INR': [r'₹', r'inr', r'rupee', r'rs\.', r'rs ', 'india'],
-            'CAD': [r'cad', r'c\$', 'canada'],
-            'AUD': [r'aud', r'a\$', 'australia'],
-            'JPY': [r'¥', r'jpy', r'yen', 'japan'],
-            'CNY': [r'¥', r'cny', r'yuan', 'china'],
-            'KRW': [r'₩', r'krw', r'won', 'korea'],
-            'THB': [r'฿', r'thb', r'baht', 'thailand'],
-            'SGD': [r'sgd', r's\$', 'singapore'],
-            'MYR': [r'myr', r'rm', 'malaysia'],
-            'PHP': [r'₱', r'php', r'peso', 'philippines'],
-            'VND': [r'₫', r'vnd', r'dong', 'vietnam'],
-            'BRL': [r'r\$', r'brl', r'real', 'brazil'],
-            'MXN': [r'mxn', r'peso', 'mexico'],
-            'ZAR': [r'zar', r'rand', 'south africa']
-        }
+        soup = page.soup()
         
         # Look for currency in meta tags and structured data
         currency_meta = soup.find('meta', {'name': 'currency'}) or soup.find('meta', {'property': 'product:price:currency'})
@@ -86,22 +452,36 @@ class EcommerceScraper:
         # Look for JSON-LD structured data
         json_scripts = soup.find_all('script', {'type': 'application/ld+json'})
         for script in json_scripts:
+            # Skip empty and non-object blocks without raising a decode error.
+            # orjson only accepts exact str, not bs4's string subclasses
+            text = str(script.string or script.get_text())
+            if '{' not in text:
+                continue
             try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and 'offers' in data:
-                    offers = data['offers']
-                    if isinstance(offers, list) and offers:
-                        offers = offers[0]
-                    if isinstance(offers, dict) and 'priceCurrency' in offers:
-                        return offers['priceCurrency'].upper()
-            except:
+                data = orjson.loads(text)
+            except ValueError:
+                continue
+            # Entities may be top-level, in a list, or wrapped in an @graph
+            if isinstance(data, dict):
+                data = data.get('@graph', [data])
+            if not isinstance(data, list):
                 continue
+            for entity in data:
+                if not isinstance(entity, dict) or 'offers' not in entity:
+                    continue
+                offers = entity['offers']
+                if isinstance(offers, list) and offers:
+                    offers = offers[0]
+                if isinstance(offers, dict) and isinstance(offers.get('priceCurrency'), str):
+                    return offers['priceCurrency'].upper()
+        
+        # Only walk the page text when the markup didn't declare a currency
+        page_text = page.lower_text()
         
         # Pattern matching in page content
-        for currency, patterns in currency_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, page_text, re.IGNORECASE):
-                    return currency
+        for currency, markers in _CURRENCY_MARKERS.items():
+            if any(marker in page_text for marker in markers):
+                return currency
         
         return 'USD'  # Default fallback
 
@@ -122,21 +502,40 @@ class EcommerceScraper:
     
     def _extract_shopify_products(self, base_url: str) -> Dict[str, Any]:
         """Extract products from Shopify JSON endpoint."""
-        products_url = urljoin(base_url, '/products.json')
-        response = self.make_request(products_url)
-        
-        if not response or response.status_code != 200:
+        if not self.is_shopify(base_url):
             return {
                 'products': [],
                 'total_count': 0,
                 'platform': 'unknown'
             }
         
-        try:
-            data = response.json()
-            products = data.get('products', [])
+        catalog = []
+        for page in range(1, self.SHOPIFY_MAX_PAGES + 1):
+            response = self.make_request(self._products_page_url(base_url, page))
+            
+            if not response or response.status_code != 200:
+                if response is not None:
+                    response.close()
+                if page == 1:
+                    return {
+                        'products': [],
+                        'total_count': 0,
+                        'platform': 'unknown'
+                    }
+                break
+            
+            try:
+                products = self._read_products(response)
+            except orjson.JSONDecodeError:
+                if page == 1:
+                    return {
+                        'products': [],
+                        'total_count': 0,
+                        'platform': 'shopify',
+                        'error': 'Invalid JSON response from products endpoint'
+                    }
+                break
             
-            catalog = []
             for product in products:
                 product_info = {
                     'id': product.get('id'),
@@ -168,25 +567,21 @@ class EcommerceScraper:
                 
                 catalog.append(product_info)
             
-            return {
-                'products': catalog,
-                'total_count': len(catalog),
-                'platform': 'shopify'
-            }
-            
-        except json.JSONDecodeError:
-            return {
-                'products': [],
-                'total_count': 0,
-                'platform': 'shopify',
-                'error': 'Invalid JSON response from products endpoint'
-            }
+            # A short page is the last one; skip the request for an empty page
+            if len(products) < self.SHOPIFY_PAGE_SIZE:
+                break
+        
+        return {
+            'products': catalog,
+            'total_count': len(catalog),
+            'platform': 'shopify'
+        }
     
     def _extract_generic_products(self, base_url: str) -> Dict[str, Any]:
         """Extract products from any e-commerce website using web scraping."""
-        response = self.make_request(base_url)
+        page = self._get_page(base_url)
         
-        if not response or response.status_code != 200:
+        if page is None:
             return {
                 'products': [],
                 'total_count': 0,
@@ -194,20 +589,12 @@ class EcommerceScraper:
                 'error': 'Could not access website'
             }
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = page.soup()
         products = []
         
         # Common e-commerce product selectors
-        product_selectors = [
-            '.product-item', '.product-card', '.product',
-            '[class*="product"]', '[data-product]',
-            '.woocommerce-LoopProduct-link', '.product-wrap',
-            '.grid-product', '.product-grid-item',
-            '.item-product', '.product-list-item'
-        ]
-        
-        for selector in product_selectors:
-            product_elements = soup.select(selector)[:50]  # Limit to 50 products
+        for sieve in _PRODUCT_SIEVES:
+            product_elements = sieve.select(soup, limit=50)  # Limit to 50 products
             
             if len(product_elements) >= 3:  # If we found a good selector
                 for elem in product_elements:
@@ -223,7 +610,7 @@ class EcommerceScraper:
         return {
             'products': products,
             'total_count': len(products),
-            'platform': self._detect_platform(soup)
+            'platform': self._detect_platform(soup, page.lower_text())
         }
     
     def _extract_product_data(self, element, base_url: str) -> Dict[str, Any]:
@@ -238,44 +625,38 @@ class EcommerceScraper:
         }
         
         # Extract title
-        title_selectors = ['h1', 'h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]', 'a']
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
+        for sieve in _TITLE_SIEVES:
+            title_elem = sieve.select_one(element)
             if title_elem and title_elem.get_text(strip=True):
                 product['title'] = title_elem.get_text(strip=True)[:200]
                 break
         
         # Extract price
-        price_selectors = [
-            '[class*="price"]', '[class*="cost"]', '[class*="amount"]',
-            '.money', '.currency', '[data-price]'
-        ]
-        for selector in price_selectors:
-            price_elem = element.select_one(selector)
+        for sieve in _PRICE_SIEVES:
+            price_elem = sieve.select_one(element)
             if price_elem:
                 price_text = price_elem.get_text(strip=True)
                 # Extract price with currency symbols
-                price_match = re.search(r'[\$£€₹¥₩฿₱₫]?[\d,.]+(\.[\d]{2})?', price_text)
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     product['price'] = price_match.group(0)
                     break
         
         # Extract image
-        img_elem = element.select_one('img')
+        img_elem = _IMG_SIEVE.select_one(element)
         if img_elem and img_elem.get('src'):
             product['image'] = urljoin(base_url, img_elem['src'])
         elif img_elem and img_elem.get('data-src'):  # Lazy loading
             product['image'] = urljoin(base_url, img_elem['data-src'])
         
         # Extract URL
-        link_elem = element.select_one('a')
+        link_elem = _LINK_SIEVE.select_one(element)
         if link_elem and link_elem.get('href'):
             product['url'] = urljoin(base_url, link_elem['href'])
         
         # Extract description
-        desc_selectors = ['.description', '.summary', '[class*="desc"]']
-        for selector in desc_selectors:
-            desc_elem = element.select_one(selector)
+        for sieve in _DESC_SIEVES:
+            desc_elem = sieve.select_one(element)
             if desc_elem:
                 product['description'] = desc_elem.get_text(strip=True)[:500]
                 break
@@ -286,10 +667,7 @@ class EcommerceScraper:
         """Fallback method to extract products when standard selectors fail."""
         products = []
         
-        # Look for any elements with prices
-        price_elements = soup.find_all(text=re.compile(r'[\$£€₹¥₩฿₱₫][\d,.]+(\.[\d]{2})?'))
-        
-        for price_elem in price_elements[:20]:  # Limit to 20
+        for price_elem in self._price_strings(soup, limit=20):
             parent = price_elem.parent
             if parent:
                 # Try to find title near the price
@@ -312,55 +690,61 @@ class EcommerceScraper:
         
         return products
     
-    def _detect_platform(self, soup) -> str:
-        """Detect the e-commerce platform being used."""
-        page_text = soup.get_text().lower()
-        
-        # Platform detection patterns
+    def _price_strings(self, soup, limit: int) -> List[Any]:
+        """Text nodes containing a price, in document order.
+        
+        Runs the price regex once over the joined page text and maps each hit
+        back to its node by offset, instead of searching every node separately.
+        """
+        strings = list(soup.strings)
+        ends = list(accumulate(len(string) for string in strings))
+        
+        found = []
+        last_index = -1
+        for match in _PRICE_TEXT_RE.finditer(''.join(strings)):
+            index = bisect_right(ends, match.start())
+            if index == last_index:
+                continue
+            # A hit running into the next node only counts if its own node matches
+            if match.end() > ends[index] and not _PRICE_TEXT_RE.search(strings[index]):
+                continue
+            last_index = index
+            found.append(strings[index])
+            if len(found) == limit:
+                break
+        return found
+    
+    def _detect_platform(self, soup, page_text: str) -> str:
+        """Detect the e-commerce platform being used from lowercased page text."""
         if 'shopify' in page_text or soup.find(attrs={'name': 'shopify-checkout-api-token'}):
             return 'shopify'
-        elif 'woocommerce' in page_text or soup.find(class_=re.compile(r'woocommerce')):
+        if 'woocommerce' in page_text or soup.find(class_=_WOOCOMMERCE_CLASS_RE):
             return 'woocommerce'
-        elif 'magento' in page_text:
-            return 'magento'
-        elif 'bigcommerce' in page_text:
-            return 'bigcommerce'
-        elif 'prestashop' in page_text:
-            return 'prestashop'
-        elif 'opencart' in page_text:
-            return 'opencart'
-        else:
-            return 'generic'
+        
+        for platform in _PLATFORM_MARKERS:
+            if platform in page_text:
+                return platform
+        return 'generic'
 
     def extract_hero_products(self, base_url: str) -> List[Dict[str, str]]:
         """Extract hero products from homepage."""
-        response = self.make_request(base_url)
+        page = self._get_page(base_url)
         
-        if not response or response.status_code != 200:
+        if page is None:
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = page.soup()
         hero_products = []
+        # Fields are always set in the same order, so equal products give equal tuples
+        seen = set()
         
         # Common selectors for hero/featured products
-        selectors = [
-            '.hero-product',
-            '.featured-product',
-            '.product-card',
-            '.product-item',
-            '[class*="hero"]',
-            '[class*="featured"]',
-            '.slider .product',
-            '.carousel .product'
-        ]
-        
-        for selector in selectors:
-            products = soup.select(selector)
-            for product in products[:6]:  # Limit to first 6 found
+        for sieve in _HERO_SIEVES:
+            for product in sieve.select(soup, limit=6):  # Limit to first 6 found
                 product_info = {}
                 
                 # Extract product title
-                title_elem = product.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or product.find(class_=re.compile(r'title|name'))
+                title_elem = product.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or product.find(class_=_TITLE_CLASS_RE)
                 if title_elem:
                     product_info['title'] = title_elem.get_text(strip=True)
                 
@@ -375,11 +759,13 @@ class EcommerceScraper:
                     product_info['image'] = urljoin(base_url, img_elem['src'])
                 
                 # Extract price
-                price_elem = product.find(class_=re.compile(r'price|cost|amount'))
+                price_elem = product.find(class_=_PRICE_CLASS_RE)
                 if price_elem:
                     product_info['price'] = price_elem.get_text(strip=True)
                 
-                if product_info and product_info not in hero_products:
+                key = tuple(product_info.items())
+                if product_info and key not in seen:
+                    seen.add(key)
                     hero_products.append(product_info)
         
         return hero_products
@@ -388,266 +774,270 @@ class EcommerceScraper:
         """Extract privacy policy, return/refund policies."""
         policies = {}
         
-        # Common policy page URLs
-        policy_urls = {
-            'privacy_policy': ['/pages/privacy-policy', '/privacy-policy', '/privacy'],
-            'return_policy': ['/pages/return-policy', '/return-policy', '/returns', '/pages/returns'],
-            'refund_policy': ['/pages/refund-policy', '/refund-policy', '/refunds', '/pages/refunds'],
-            'terms_of_service': ['/pages/terms-of-service', '/terms-of-service', '/terms', '/pages/terms'],
-            'shipping_policy': ['/pages/shipping-policy', '/shipping-policy', '/shipping', '/pages/shipping']
-        }
-        
-        for policy_name, urls in policy_urls.items():
-            for url_path in urls:
-                full_url = urljoin(base_url, url_path)
-                response = self.make_request(full_url)
-                
-                if response and response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Remove unwanted elements
-                    for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-                        element.decompose()
-                    
-                    # Extract main content
-                    content_selectors = ['.main-content', '.content', '.policy-content', 'main', '.page-content']
-                    content = None
-                    
-                    for selector in content_selectors:
-                        content_elem = soup.select_one(selector)
-                        if content_elem:
-                            content = content_elem.get_text(separator=' ', strip=True)
-                            break
-                    
-                    if not content:
-                        content = soup.get_text(separator=' ', strip=True)
-                    
-                    if content and len(content) > 100:  # Only store if substantial content
-                        policies[policy_name] = content[:2000]  # Limit content length
-                        break
+        for policy_name, urls in self.POLICY_PATHS.items():
+            content = self._first_usable(base_url, urls, self._policy_text)
+            if content is not None:
+                policies[policy_name] = content
         
         return policies
 
+    def _policy_text(self, page: FetchedPage) -> Optional[str]:
+        """Main text of a policy page, or None if it has no substantial content."""
+        soup = self._soup(page.content)
+        
+        # Remove unwanted elements
+        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
+            element.decompose()
+        
+        # Extract main content
+        content_selectors = ['.main-content', '.content', '.policy-content', 'main', '.page-content']
+        content = None
+        
+        for selector in content_selectors:
+            content_elem = soup.select_one(selector)
+            if content_elem:
+                content = content_elem.get_text(separator=' ', strip=True)
+                break
+        
+        if not content:
+            content = soup.get_text(separator=' ', strip=True)
+        
+        if content and len(content) > 100:  # Only store if substantial content
+            return content[:2000]  # Limit content length
+        return None
+
     def extract_faqs(self, base_url: str) -> List[Dict[str, str]]:
         """Extract FAQs from the website."""
+        faqs = self._first_usable(base_url, self.FAQ_PATHS, self._page_faqs) or []
+        return faqs[:20]  # Limit to 20 FAQs
+
+    def _page_faqs(self, page: FetchedPage) -> Optional[List[Dict[str, str]]]:
+        """Question/answer pairs found on a page, or None if there are none."""
+        soup = self._soup(page.content)
         faqs = []
         
-        # Common FAQ page URLs
-        faq_urls = ['/pages/faq', '/faq', '/pages/frequently-asked-questions', '/help']
-        
-        for url_path in faq_urls:
-            full_url = urljoin(base_url, url_path)
-            response = self.make_request(full_url)
+        # Look for FAQ structures
+        for sieve in _FAQ_SIEVES:
+            faq_items = sieve.select(soup)
             
-            if response and response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for FAQ structures
-                faq_selectors = [
-                    '.faq-item',
-                    '.question',
-                    '.accordion-item',
-                    '[class*="faq"]',
-                    '.qa-pair'
-                ]
+            for item in faq_items:
+                question_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or item.find(class_=_QUESTION_CLASS_RE)
+                answer_elem = item.find(class_=_ANSWER_CLASS_RE) or item.find('p')
                 
-                for selector in faq_selectors:
-                    faq_items = soup.select(selector)
+                if question_elem and answer_elem:
+                    question = question_elem.get_text(strip=True)
+                    answer = answer_elem.get_text(strip=True)
                     
-                    for item in faq_items:
-                        question_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or item.find(class_=re.compile(r'question|q\b'))
-                        answer_elem = item.find(class_=re.compile(r'answer|a\b')) or item.find('p')
-                        
-                        if question_elem and answer_elem:
-                            question = question_elem.get_text(strip=True)
-                            answer = answer_elem.get_text(strip=True)
-                            
-                            if question and answer and len(question) > 5 and len(answer) > 5:
-                                faqs.append({
-                                    'question': question,
-                                    'answer': answer
-                                })
-                
-                if faqs:
-                    break
+                    if question and answer and len(question) > 5 and len(answer) > 5:
+                        faqs.append({
+                            'question': question,
+                            'answer': answer
+                        })
         
-        return faqs[:20]  # Limit to 20 FAQs
+        return faqs or None
 
     def extract_social_handles(self, base_url: str) -> Dict[str, str]:
         """Extract social media handles."""
-        response = self.make_request(base_url)
+        page = self._get_page(base_url)
         
-        if not response or response.status_code != 200:
+        if page is None:
             return {}
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = page.soup()
         social_handles = {}
         
-        # Social media patterns
-        social_patterns = {
-            'instagram': [r'instagram\.com/([^/\s"\']+)', r'@([a-zA-Z0-9_.]+)'],
-            'facebook': [r'facebook\.com/([^/\s"\']+)', r'fb\.com/([^/\s"\']+)'],
-            'twitter': [r'twitter\.com/([^/\s"\']+)', r'x\.com/([^/\s"\']+)'],
-            'tiktok': [r'tiktok\.com/@([^/\s"\']+)'],
-            'youtube': [r'youtube\.com/(?:channel/|user/|c/)?([^/\s"\']+)'],
-            'linkedin': [r'linkedin\.com/(?:company/|in/)?([^/\s"\']+)'],
-            'pinterest': [r'pinterest\.com/([^/\s"\']+)']
-        }
-        
-        # Find all links
-        links = soup.find_all('a', href=True)
-        page_text = soup.get_text()
+        # Link and rel="me" hrefs in document order, one per line. No pattern
+        # matches across a newline, so one search finds the same first link a
+        # per-link loop would. Page text and mailto: addresses are left out: a
+        # bare @ there is usually an email, not a profile
+        hrefs = '\n'.join(
+            link['href'] for link in _SOCIAL_LINK_SIEVE.select(soup)
+            if not link['href'].startswith('mailto:')
+        )
         
-        for platform, patterns in social_patterns.items():
+        for platform, patterns in _SOCIAL_PATTERNS.items():
             for pattern in patterns:
-                # Check in links
-                for link in links:
-                    href = link.get('href', '')
-                    match = re.search(pattern, href)
-                    if match:
-                        social_handles[platform] = match.group(1)
-                        break
-                
-                # Check in page text
-                if platform not in social_handles:
-                    match = re.search(pattern, page_text)
-                    if match:
-                        social_handles[platform] = match.group(1)
-                
-                if platform in social_handles:
+                match = pattern.search(hrefs)
+                if match:
+                    social_handles[platform] = match.group(1)
                     break
         
         return social_handles
 
     def extract_contact_details(self, base_url: str) -> Dict[str, Any]:
         """Extract contact details like emails and phone numbers."""
-        response = self.make_request(base_url)
+        page = self._get_page(base_url)
         
-        if not response or response.status_code != 200:
+        if page is None:
             return {}
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        contact_info = self._page_contacts(page)
+        
+        # Try to find contact page for more details; the first one fetched decides
+        contact_info['address'] = self._first_usable(base_url, self.CONTACT_PATHS, self._page_addresses) or []
+        
+        return contact_info
+
+    def _page_contacts(self, page: FetchedPage) -> Dict[str, Any]:
+        """Emails and phone numbers found in a page's text; address is left empty."""
         contact_info = {
             'emails': [],
             'phones': [],
             'address': []
         }
         
-        page_text = soup.get_text()
-        
-        # Extract emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, page_text)
-        contact_info['emails'] = list(set(emails))[:5]  # Limit to 5 unique emails
-        
-        # Extract phone numbers
-        phone_patterns = [
-            r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'(\+\d{1,3}[-.\s]?)?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'(\+\d{1,3}[-.\s]?)?\d{10,}'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, page_text)
-            contact_info['phones'].extend(phones)
+        page_text = page.text()
         
-        contact_info['phones'] = list(set(contact_info['phones']))[:5]
+        # Extract emails and phone numbers, deduplicated in page order
+        found = {'email': {}, 'phone': {}}
+        for match in _CONTACT_RE.finditer(page_text):
+            found[match.lastgroup][match.group()] = None
         
-        # Try to find contact page for more details
-        contact_urls = ['/pages/contact', '/contact', '/contact-us', '/pages/contact-us']
-        
-        for url_path in contact_urls:
-            full_url = urljoin(base_url, url_path)
-            response = self.make_request(full_url)
-            
-            if response and response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract address information
-                address_selectors = ['.address', '.contact-address', '[class*="address"]']
-                for selector in address_selectors:
-                    address_elem = soup.select_one(selector)
-                    if address_elem:
-                        address = address_elem.get_text(strip=True)
-                        if len(address) > 10:
-                            contact_info['address'].append(address)
-                
-                break
+        contact_info['emails'] = list(found['email'])[:5]  # Limit to 5 unique emails
+        contact_info['phones'] = list(found['phone'])[:5]
         
         return contact_info
 
+    def _page_addresses(self, page: FetchedPage) -> List[str]:
+        """Address blocks on a contact page, possibly none."""
+        soup = self._soup(page.content, parse_only=_ADDRESS_STRAINER)
+        addresses = []
+        
+        # Extract address information
+        address_selectors = ['.address', '.contact-address', '[class*="address"]']
+        for selector in address_selectors:
+            address_elem = soup.select_one(selector)
+            if address_elem:
+                address = address_elem.get_text(strip=True)
+                if len(address) > 10:
+                    addresses.append(address)
+        
+        return addresses
+
     def extract_brand_context(self, base_url: str) -> str:
         """Extract brand context and about information."""
-        about_urls = ['/pages/about', '/about', '/pages/about-us', '/about-us', '/pages/our-story', '/our-story']
-        
-        for url_path in about_urls:
-            full_url = urljoin(base_url, url_path)
-            response = self.make_request(full_url)
-            
-            if response and response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-                    element.decompose()
-                
-                # Extract main content
-                content_selectors = ['.main-content', '.content', '.about-content', 'main', '.page-content']
-                
-                for selector in content_selectors:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
-                        content = content_elem.get_text(separator=' ', strip=True)
-                        if len(content) > 100:
-                            return content[:1500]  # Limit content length
-                
-                # Fallback to body content
-                body_content = soup.get_text(separator=' ', strip=True)
-                if len(body_content) > 100:
-                    return body_content[:1500]
-        
-        return ""
+        return self._first_usable(base_url, self.ABOUT_PATHS, self._page_brand_context) or ""
+
+    def _page_brand_context(self, page: FetchedPage) -> Optional[str]:
+        """Main text of an about page, or None if it has no substantial content."""
+        soup = self._soup(page.content)
+        
+        # Remove unwanted elements
+        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
+            element.decompose()
+        
+        # Extract main content
+        content_selectors = ['.main-content', '.content', '.about-content', 'main', '.page-content']
+        
+        for selector in content_selectors:
+            content_elem = soup.select_one(selector)
+            if content_elem:
+                content = content_elem.get_text(separator=' ', strip=True)
+                if len(content) > 100:
+                    return content[:1500]  # Limit content length
+        
+        # Fallback to body content
+        body_content = soup.get_text(separator=' ', strip=True)
+        if len(body_content) > 100:
+            return body_content[:1500]
+        return None
 
     def extract_important_links(self, base_url: str) -> Dict[str, str]:
         """Extract important links like order tracking, contact us, blogs."""
-        response = self.make_request(base_url)
+        page = self._get_page(base_url)
         
-        if not response or response.status_code != 200:
+        if page is None:
             return {}
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = page.soup()
         important_links = {}
         
-        # Define patterns for important links
-        link_patterns = {
-            'order_tracking': [r'track', r'order.*track', r'track.*order'],
-            'contact_us': [r'contact', r'contact.*us'],
-            'blog': [r'blog', r'news', r'articles'],
-            'support': [r'support', r'help', r'customer.*service'],
-            'store_locator': [r'store.*locat', r'find.*store', r'locations'],
-            'size_guide': [r'size.*guide', r'sizing', r'fit.*guide']
-        }
-        
         # Find all links
         links = soup.find_all('a', href=True)
         
-        for link_type, patterns in link_patterns.items():
+        for link_type, pattern in _LINK_PATTERNS.items():
             for link in links:
                 href = link.get('href', '')
                 text = link.get_text(strip=True).lower()
                 
-                for pattern in patterns:
-                    if re.search(pattern, text, re.IGNORECASE) or re.search(pattern, href, re.IGNORECASE):
-                        full_url = urljoin(base_url, href)
-                        important_links[link_type] = full_url
-                        break
+                if pattern.search(text) or pattern.search(href):
+                    important_links[link_type] = urljoin(base_url, href)
                 
                 if link_type in important_links:
                     break
         
         return important_links
 
+    def _cache_key(self, website_url: str) -> Optional[str]:
+        """Normalize a URL into an insights cache key."""
+        try:
+            parsed = urlparse(self.validate_url(website_url))
+        except ValueError:
+            return None
+        return parsed.netloc.lower() + parsed.path.rstrip('/')
+
+    def _get_cached_insights(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of cached insights so callers can add keys freely."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self.cache.get(key)
+        return dict(cached) if cached is not None else None
+
+    @classmethod
+    def clear_cache(cls) -> int:
+        """Drop all cached insights and return how many entries were removed."""
+        with cls._cache_lock:
+            cleared = len(cls.cache)
+            cls.cache.clear()
+        return cleared
+
     def extract_all_insights(self, website_url: str) -> Dict[str, Any]:
+        """Extract all insights, serving recently scraped sites from the cache."""
+        key = self._cache_key(website_url)
+        cached = self._get_cached_insights(key)
+        if cached is not None:
+            self.logger.info(f"Serving cached insights for: {website_url}")
+            return cached
+        
+        insights = self._extract_all_insights(website_url)
+        self._cache_insights(key, insights)
+        return insights
+
+    def _cache_insights(self, key: Optional[str], insights: Dict[str, Any]):
+        """Keep a copy of successful insights for later calls."""
+        if key is not None and not insights.get('error'):
+            with self._cache_lock:
+                self.cache[key] = dict(insights)
+
+    def _homepage_error(self, response: Optional[Union[requests.Response, FetchedPage]]) -> Optional[Dict[str, Any]]:
+        """Error result for a homepage fetch that failed or didn't return 200, else None.
+        
+        A Response is falsy for any 4xx/5xx, so this tests for None to let real
+        statuses reach the status checks. None means the connection failed or
+        timed out, which bulk runs retry, so that error is marked transient.
+        """
+        if response is None:
+            return {
+                'error': 'Website not accessible or does not exist',
+                'status_code': 401,
+                'transient': True
+            }
+        
+        if response.status_code == 404:
+            return {
+                'error': 'Website not found',
+                'status_code': 404
+            }
+        
+        if response.status_code != 200:
+            return {
+                'error': f'Website returned status code {response.status_code}',
+                'status_code': response.status_code
+            }
+        return None
+
+    def _extract_all_insights(self, website_url: str) -> Dict[str, Any]:
         """Extract all insights from any e-commerce website."""
         try:
             # Validate URL
@@ -655,26 +1045,15 @@ class EcommerceScraper:
             
             # Check if website is accessible
             response = self.make_request(website_url)
-            if not response:
-                return {
-                    'error': 'Website not accessible or does not exist',
-                    'status_code': 401
-                }
-            
-            if response.status_code == 404:
-                return {
-                    'error': 'Website not found',
-                    'status_code': 404
-                }
-            
-            if response.status_code != 200:
-                return {
-                    'error': f'Website returned status code {response.status_code}',
-                    'status_code': response.status_code
-                }
+            error = self._homepage_error(response)
+            if error is not None:
+                return error
             
             self.logger.info(f"Starting extraction for: {website_url}")
             
+            # Probe the platform once up front so the extractors share the cached answer
+            self.is_shopify(website_url)
+            
             # Initialize results
             insights = {
                 'website_url': website_url,
@@ -683,29 +1062,34 @@ class EcommerceScraper:
             }
             
             # Extract all data
+            token = None
             try:
-                insights['product_catalog'] = self.extract_products_catalog(website_url)
-                time.sleep(1)  # Rate limiting
-                
-                insights['hero_products'] = self.extract_hero_products(website_url)
-                time.sleep(1)
-                
-                insights['policies'] = self.extract_policies(website_url)
-                time.sleep(1)
-                
-                insights['faqs'] = self.extract_faqs(website_url)
-                time.sleep(1)
-                
-                insights['social_handles'] = self.extract_social_handles(website_url)
-                time.sleep(1)
-                
-                insights['contact_details'] = self.extract_contact_details(website_url)
-                time.sleep(1)
+                extractors = {
+                    'product_catalog': self.extract_products_catalog,
+                    'hero_products': self.extract_hero_products,
+                    'policies': self.extract_policies,
+                    'faqs': self.extract_faqs,
+                    'social_handles': self.extract_social_handles,
+                    'contact_details': self.extract_contact_details,
+                    'brand_context': self.extract_brand_context,
+                    'important_links': self.extract_important_links
+                }
                 
-                insights['brand_context'] = self.extract_brand_context(website_url)
-                time.sleep(1)
+                # Five extractors read the homepage; hand them the copy fetched above
+                # instead of letting each one request it again
+                token = _prefetched_pages.set({website_url: FetchedPage(
+                    url=website_url, status_code=response.status_code, content=response.content
+                )})
                 
-                insights['important_links'] = self.extract_important_links(website_url)
+                # Fan the extractors out over the shared connection pool; each task
+                # runs in a copy of this context so prefetched pages stay visible
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = {
+                        key: executor.submit(contextvars.copy_context().run, extractor, website_url)
+                        for key, extractor in extractors.items()
+                    }
+                    for key, future in futures.items():
+                        insights[key] = future.result()
                 
                 self.logger.info(f"Successfully extracted insights for: {website_url}")
                 return insights
@@ -717,6 +1101,9 @@ class EcommerceScraper:
                     'status_code': 500,
                     'details': str(e)
                 }
+            finally:
+                if token is not None:
+                    _prefetched_pages.reset(token)
             
         except ValueError as e:
             return {
@@ -730,3 +1117,121 @@ class EcommerceScraper:
                 'status_code': 500,
                 'details': str(e)
             }
+
+    async def _afetch(self, session: 'aiohttp.ClientSession', url: str, timeout: int = 10, method: str = 'GET') -> Optional[FetchedPage]:
+        """Fetch a single page asynchronously with error handling; HEAD leaves content empty."""
+        import aiohttp
+        
+        try:
+            await self.rate_limiter.wait_async(url)
+            async with session.request(method, url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                return FetchedPage(url=url, status_code=response.status, content=await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"{method} request failed for {url}: {str(e) or type(e).__name__}")
+            return None
+
+    async def _afirst_usable(self, session: 'aiohttp.ClientSession', base_url: str, paths: List[str], parse: Callable[[FetchedPage], Optional[T]]) -> Optional[T]:
+        """Async counterpart of _first_usable: probe and fetch with aiohttp, stopping at the first usable page."""
+        for url_path in self._site_paths(base_url, paths):
+            full_url = urljoin(base_url, url_path)
+            probe = await self._afetch(session, full_url, timeout=5, method='HEAD')
+            if not self._worth_fetching(probe.status_code if probe is not None else None):
+                continue
+            
+            page = await self._afetch(session, full_url)
+            if page is not None and page.status_code == 200:
+                result = parse(page)
+                if result is not None:
+                    return result
+        return None
+
+    async def _afetch_products_pages(self, session: 'aiohttp.ClientSession', base_url: str, pages: Dict[str, Optional[FetchedPage]]):
+        """Fetch /products.json pages into pages, stopping where _extract_shopify_products stops reading."""
+        for page in range(1, self.SHOPIFY_MAX_PAGES + 1):
+            url = self._products_page_url(base_url, page)
+            response = pages[url] = await self._afetch(session, url)
+            if response is None or response.status_code != 200:
+                break
+            try:
+                products = self._read_products(response)
+            except orjson.JSONDecodeError:
+                break
+            if len(products) < self.SHOPIFY_PAGE_SIZE:
+                break
+
+    async def async_extract_all_insights(self, session: 'aiohttp.ClientSession', website_url: str) -> Dict[str, Any]:
+        """Extract all insights on the event loop, awaiting every page fetch.
+        
+        The homepage is fetched first, so an unreachable or failing site costs
+        one request. The /products.json pages follow, then the policy, FAQ,
+        contact and about candidates, each group probed lazily and stopping at
+        its first usable page as on the synchronous path. The extractors that
+        read only the homepage or the products pages run on the fetched copies
+        and make no requests of their own. Pages are parsed on the loop thread.
+        """
+        try:
+            website_url = self.validate_url(website_url)
+        except ValueError as e:
+            return {
+                'error': f'Invalid URL: {str(e)}',
+                'status_code': 400
+            }
+        
+        key = self._cache_key(website_url)
+        cached = self._get_cached_insights(key)
+        if cached is not None:
+            return cached
+        
+        homepage = await self._afetch(session, website_url)
+        error = self._homepage_error(homepage)
+        if error is not None:
+            return error
+        
+        self.logger.info(f"Starting extraction for: {website_url}")
+        
+        # is_shopify, make_request and _get_page read these instead of the network
+        pages = {website_url: homepage}
+        token = _prefetched_pages.set(pages)
+        try:
+            await self._afetch_products_pages(session, website_url, pages)
+            
+            *policy_texts, faqs, addresses, brand_context = await asyncio.gather(
+                *(self._afirst_usable(session, website_url, urls, self._policy_text) for urls in self.POLICY_PATHS.values()),
+                self._afirst_usable(session, website_url, self.FAQ_PATHS, self._page_faqs),
+                self._afirst_usable(session, website_url, self.CONTACT_PATHS, self._page_addresses),
+                self._afirst_usable(session, website_url, self.ABOUT_PATHS, self._page_brand_context)
+            )
+            
+            contact_details = self._page_contacts(homepage)
+            contact_details['address'] = addresses or []
+            
+            insights = {
+                'website_url': website_url,
+                'extraction_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'status': 'success',
+                'product_catalog': self.extract_products_catalog(website_url),
+                'hero_products': self.extract_hero_products(website_url),
+                'policies': {
+                    policy_name: content
+                    for policy_name, content in zip(self.POLICY_PATHS, policy_texts)
+                    if content is not None
+                },
+                'faqs': (faqs or [])[:20],
+                'social_handles': self.extract_social_handles(website_url),
+                'contact_details': contact_details,
+                'brand_context': brand_context or "",
+                'important_links': self.extract_important_links(website_url)
+            }
+        except Exception as e:
+            self.logger.error(f"Error during data extraction: {str(e)}")
+            return {
+                'error': 'Error occurred during data extraction',
+                'status_code': 500,
+                'details': str(e)
+            }
+        finally:
+            _prefetched_pages.reset(token)
+        
+        self.logger.info(f"Successfully extracted insights for: {website_url}")
+        self._cache_insights(key, insights)
+        return insights
@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+import pytest
+
+# app.py reads DATABASE_URL at import time, so point it at a scratch database
+# before any test module imports it
+_db_dir = tempfile.mkdtemp(prefix='shopify-insights-tests-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_db_dir, 'test.db')
+os.environ.pop('REDIS_URL', None)
+
+
+@pytest.fixture
+def app():
+    from app import app as flask_app
+    from models import db, AnalysisHistory, CompetitorAnalysis
+
+    flask_app.config['TESTING'] = True
+    with flask_app.app_context():
+        yield flask_app
+        db.session.rollback()
+        db.session.query(CompetitorAnalysis).delete()
+        db.session.query(AnalysisHistory).delete()
+        db.session.commit()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
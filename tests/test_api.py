@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from models import AnalysisHistory, db
+
+
+def _add_history(count, start=datetime(2024, 1, 1)):
+    # Pairs of rows share a created_at so paging has to break ties on id
+    rows = [
+        AnalysisHistory(
+            website_url=f'https://store{i}.example',
+            analysis_data={'i': i},
+            created_at=start + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    db.session.add_all(rows)
+    db.session.commit()
+    return sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)
+
+
+def test_history_pages_with_keyset_cursor(client):
+    expected = [row.id for row in _add_history(45)]
+
+    seen, pages, params = [], 0, {}
+    while True:
+        response = client.get('/api/history', query_string=params)
+        assert response.status_code == 200
+        body = response.get_json()
+        seen += [row['id'] for row in body['analyses']]
+        pages += 1
+        if body['next_cursor'] is None:
+            break
+        params = body['next_cursor']
+
+    assert pages == 3
+    assert seen == expected
+
+
+def test_history_cursor_splits_tied_timestamps(client):
+    rows = _add_history(4)
+    # rows[0] and rows[1] share created_at; continuing after rows[0] must keep rows[1]
+    params = {'before': rows[0].created_at.isoformat(), 'before_id': rows[0].id}
+    body = client.get('/api/history', query_string=params).get_json()
+    assert [row['id'] for row in body['analyses']] == [row.id for row in rows[1:]]
+    assert body['next_cursor'] is None
+
+
+def test_history_before_without_id(client):
+    rows = _add_history(4)
+    body = client.get('/api/history', query_string={'before': rows[0].created_at.isoformat()}).get_json()
+    assert [row['id'] for row in body['analyses']] == [row.id for row in rows[2:]]
+
+
+def test_history_empty(client):
+    body = client.get('/api/history').get_json()
+    assert body == {'analyses': [], 'next_cursor': None}
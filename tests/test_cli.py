@@ -0,0 +1,52 @@
+from sqlalchemy import insert, select, update
+
+from models import ZSTD_MAGIC, AnalysisHistory, CompressedJSON, db
+
+
+def _insert_without_metrics(website_url, analysis_data):
+    analysis_id = db.session.scalar(
+        insert(AnalysisHistory).returning(AnalysisHistory.id),
+        {'website_url': website_url, 'analysis_data': analysis_data}
+    )
+    # Rows stored before the summary columns existed have them NULL
+    db.session.execute(
+        update(AnalysisHistory.__table__)
+        .where(AnalysisHistory.__table__.c.id == analysis_id)
+        .values(total_products=None, has_social_handles=None, has_contact_info=None, has_policies=None)
+    )
+    return analysis_id
+
+
+def test_backfill_metrics_command(app):
+    # Large enough that CompressedJSON stores it zstd-compressed
+    catalog = {'products': [{'id': i, 'title': f'Product {i}'} for i in range(1000)], 'total_count': 1000}
+    assert CompressedJSON().process_bind_param(catalog, None)[:4] == ZSTD_MAGIC
+    large_id = _insert_without_metrics('https://large.example', {
+        'product_catalog': catalog,
+        'social_handles': {'instagram': 'large'},
+        'contact_details': {'emails': [], 'phones': ['555-123-4567']},
+        'policies': {},
+    })
+    small_id = _insert_without_metrics('https://small.example', {
+        'product_catalog': {'products': [], 'total_count': 0},
+        'social_handles': {},
+        'contact_details': {'emails': [], 'phones': []},
+        'policies': {'privacy_policy': 'We keep your data safe.'},
+    })
+    failed_id = _insert_without_metrics('https://failed.example', {'error': 'Website not found', 'status_code': 404})
+    db.session.commit()
+
+    table = AnalysisHistory.__table__
+    metrics = select(table.c.id, table.c.total_products, table.c.has_social_handles,
+                     table.c.has_contact_info, table.c.has_policies)
+    assert {tuple(row[1:]) for row in db.session.execute(metrics)} == {(None, None, None, None)}
+
+    result = app.test_cli_runner().invoke(args=['backfill-metrics'])
+    assert result.exit_code == 0, result.output
+    assert result.output == 'Updated metrics for 3 analyses\n'
+
+    assert {row.id: tuple(row[1:]) for row in db.session.execute(metrics)} == {
+        large_id: (1000, True, True, False),
+        small_id: (0, False, False, True),
+        failed_id: (0, False, False, False),
+    }
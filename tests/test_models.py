@@ -0,0 +1,142 @@
+from datetime import datetime
+
+import orjson
+import pytest
+from flask import Flask
+from sqlalchemy import Column, MetaData, String, Table, inspect, insert, select, text
+from sqlalchemy.orm import undefer
+from sqlalchemy.schema import CreateTable
+
+from models import (
+    ZSTD_MAGIC, AnalysisHistory, CompressedJSON, db, ensure_schema, schema_fingerprint,
+    schema_meta,
+)
+
+
+@pytest.fixture
+def column_type():
+    return CompressedJSON()
+
+
+def test_small_payload_is_stored_uncompressed(column_type):
+    value = {'store': 'example.com', 'products': [1, 2, 3]}
+    data = column_type.process_bind_param(value, None)
+    assert data == orjson.dumps(value)
+    assert column_type.process_result_value(data, None) == value
+
+
+def test_compression_starts_at_threshold(column_type):
+    threshold = CompressedJSON.COMPRESS_THRESHOLD
+    # orjson adds two quote bytes around a string
+    below = 'x' * (threshold - 3)
+    at = 'x' * (threshold - 2)
+
+    below_data = column_type.process_bind_param(below, None)
+    assert len(below_data) == threshold - 1
+    assert below_data[:4] != ZSTD_MAGIC
+
+    at_data = column_type.process_bind_param(at, None)
+    assert at_data[:4] == ZSTD_MAGIC
+    assert len(at_data) < threshold
+    assert column_type.process_result_value(at_data, None) == at
+
+
+def test_large_payload_round_trips(column_type):
+    value = {'products': [{'id': i, 'title': f'Product {i}', 'tags': ['a', 'b']} for i in range(1000)]}
+    data = column_type.process_bind_param(value, None)
+    assert data[:4] == ZSTD_MAGIC
+    assert column_type.process_result_value(memoryview(data), None) == value
+
+
+@pytest.mark.parametrize('legacy', ['{"a": [1, 2]}', {'a': [1, 2]}, b'{"a": [1, 2]}'])
+def test_reads_legacy_json_values(column_type, legacy):
+    assert column_type.process_result_value(legacy, None) == {'a': [1, 2]}
+
+
+def test_none_passes_through(column_type):
+    assert column_type.process_bind_param(None, None) is None
+    assert column_type.process_result_value(None, None) is None
+
+
+def test_legacy_text_row_loads_through_orm(app):
+    db.session.execute(
+        text("INSERT INTO analysis_history (website_url, analysis_data, created_at) "
+             "VALUES ('https://legacy.example', '{\"brand\": \"Legacy\"}', '2024-01-01 00:00:00.000000')")
+    )
+    large = {'products': ['p' * 40] * 1000}
+    db.session.add(AnalysisHistory(website_url='https://large.example', analysis_data=large))
+    db.session.commit()
+
+    rows = db.session.execute(
+        select(AnalysisHistory).options(undefer(AnalysisHistory.analysis_data))
+        .order_by(AnalysisHistory.id)
+    ).scalars().all()
+    assert [row.analysis_data for row in rows] == [{'brand': 'Legacy'}, large]
+
+
+@pytest.fixture
+def legacy_app(tmp_path):
+    """App bound to a database whose tables predate the composite indexes."""
+    legacy = Flask(__name__)
+    legacy.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + str(tmp_path / 'legacy.db')
+    db.init_app(legacy)
+    with legacy.app_context():
+        with db.engine.begin() as conn:
+            # CREATE TABLE alone leaves out the declared indexes, as create_all
+            # did for tables that already existed
+            for table in db.metadata.sorted_tables:
+                conn.execute(CreateTable(table))
+            conn.execute(text("CREATE INDEX ix_analysis_history_website_url ON analysis_history (website_url)"))
+            # Fingerprint stored by a version that didn't reconcile indexes
+            stale = Table(
+                '_schema_meta', MetaData(),
+                Column('key', String(50), primary_key=True),
+                Column('value', String(64)),
+            )
+            stale.create(conn)
+            conn.execute(insert(stale).values(key='fingerprint', value='0' * 32))
+            conn.execute(text(
+                "INSERT INTO analysis_history (website_url, analysis_data) "
+                "VALUES ('https://legacy.example', '{\"brand\": \"Legacy\"}')"
+            ))
+        yield legacy
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def _index_names(table):
+    return {index['name'] for index in inspect(db.engine).get_indexes(table)}
+
+
+def test_ensure_schema_adds_indexes_to_existing_tables(legacy_app):
+    missing = {index.name for table in db.metadata.sorted_tables for index in table.indexes}
+    assert not missing & (_index_names('analysis_history') | _index_names('competitor_analysis'))
+
+    assert ensure_schema() is True
+
+    for table in db.metadata.sorted_tables:
+        assert {index.name for index in table.indexes} <= _index_names(table.name)
+    with db.engine.connect() as conn:
+        assert conn.execute(select(schema_meta.c.value)).scalar() == schema_fingerprint()
+        assert conn.execute(select(AnalysisHistory.__table__.c.website_url)).scalar() == 'https://legacy.example'
+
+    assert ensure_schema() is False
+
+
+def test_ensure_schema_creates_fresh_database(tmp_path):
+    fresh = Flask(__name__)
+    fresh.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + str(tmp_path / 'fresh.db')
+    db.init_app(fresh)
+    with fresh.app_context():
+        assert ensure_schema() is True
+        assert ensure_schema() is False
+        assert 'ix_ah_url_created' in _index_names('analysis_history')
+        db.session.add(AnalysisHistory(
+            website_url='https://fresh.example', analysis_data={'ok': True},
+            created_at=datetime(2024, 1, 1)
+        ))
+        db.session.commit()
+        assert db.session.execute(select(AnalysisHistory.website_url)).scalar() == 'https://fresh.example'
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,378 @@
+import asyncio
+import re
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+import advanced_scraper
+import shopify_scraper
+from advanced_scraper import AdvancedEcommerceScraper
+from shopify_scraper import _PRICE_TEXT_RE, EcommerceScraper, FetchedPage, HostRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(shopify_scraper.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(shopify_scraper.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_burst_is_free_then_spaced_by_interval(clock):
+    limiter = HostRateLimiter(requests_per_second=10, burst=3)
+    delays = [limiter._reserve('https://a.example/page') for _ in range(5)]
+    assert delays == pytest.approx([-0.2, -0.1, 0.0, 0.1, 0.2])
+
+
+def test_hosts_have_separate_buckets(clock):
+    limiter = HostRateLimiter(requests_per_second=10, burst=1)
+    assert limiter._reserve('https://a.example/') == pytest.approx(0.0)
+    assert limiter._reserve('https://A.example/other') == pytest.approx(0.1)
+    assert limiter._reserve('https://b.example/') == pytest.approx(0.0)
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = HostRateLimiter(requests_per_second=10, burst=2)
+    for _ in range(4):
+        limiter._reserve('https://a.example/')
+    # Two requests over the burst: the deficit is 0.2s
+    clock.now += 0.1
+    assert limiter._reserve('https://a.example/') == pytest.approx(0.2)
+    # Idle long enough to refill completely
+    clock.now += 10
+    assert limiter._reserve('https://a.example/') == pytest.approx(-0.1)
+
+
+def test_wait_only_sleeps_for_the_deficit(clock):
+    limiter = HostRateLimiter(requests_per_second=4, burst=2)
+    for _ in range(4):
+        limiter.wait('https://a.example/')
+    assert clock.sleeps == pytest.approx([0.25, 0.5])
+
+
+def test_wait_async_only_sleeps_for_the_deficit(clock, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(shopify_scraper.asyncio, 'sleep', fake_sleep)
+    limiter = HostRateLimiter(requests_per_second=4, burst=1)
+
+    async def run():
+        for _ in range(3):
+            await limiter.wait_async('https://a.example/')
+
+    asyncio.run(run())
+    assert sleeps == pytest.approx([0.25, 0.5])
+
+
+@pytest.fixture
+def bulk_scraper(monkeypatch):
+    """Scraper whose bulk runs fetch through a stub and never sleep between attempts."""
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(advanced_scraper.asyncio, 'sleep', no_sleep)
+    EcommerceScraper.clear_cache()
+    yield AdvancedEcommerceScraper()
+    EcommerceScraper.clear_cache()
+    EcommerceScraper._shopify_hosts.clear()
+
+
+def _stub_fetch(monkeypatch, scraper, homepage_results):
+    """Serve homepage_results in turn for the homepage and 404 for every other URL."""
+    calls = []
+
+    async def fake_afetch(session, url, timeout=10, method='GET'):
+        calls.append((method, url))
+        if url == 'https://flaky.example':
+            result = homepage_results.pop(0)
+            if result is None:
+                return None
+            return FetchedPage(url=url, status_code=result, content=b'<html><body>Flaky store</body></html>')
+        return FetchedPage(url=url, status_code=404, content=b'')
+
+    monkeypatch.setattr(scraper, '_afetch', fake_afetch)
+    return calls
+
+
+def test_bulk_retries_unreachable_site(bulk_scraper, monkeypatch):
+    # First attempt: the connection fails; second attempt: the homepage loads
+    calls = _stub_fetch(monkeypatch, bulk_scraper, [None, 200])
+    [(url, outcome, _elapsed)] = bulk_scraper.iter_bulk_analyze(['https://flaky.example'])
+
+    assert url == 'https://flaky.example'
+    assert 'error' not in outcome
+    assert outcome['status'] == 'success'
+    assert calls.count(('GET', 'https://flaky.example')) == 2
+
+
+def test_bulk_does_not_retry_missing_site(bulk_scraper, monkeypatch):
+    calls = _stub_fetch(monkeypatch, bulk_scraper, [404, 200])
+    [(_url, outcome, _elapsed)] = bulk_scraper.iter_bulk_analyze(['https://flaky.example'])
+
+    assert outcome['status_code'] == 404
+    assert calls == [('GET', 'https://flaky.example')]
+
+
+@pytest.fixture
+def analyzer():
+    return AdvancedEcommerceScraper()
+
+
+def _product(title, product_type='', tags=()):
+    return {'title': title, 'product_type': product_type, 'tags': list(tags)}
+
+
+def test_categorize_products(analyzer):
+    products = [
+        _product('Graphic Tee'),
+        _product('Trail Runner', product_type='Sneakers'),
+        _product('Weekend Carry-All', tags=['Gift', 'BAG']),
+        _product('Yoga Pants'),
+        _product('Street Style Cap'),
+    ]
+    result = analyzer.categorize_products(products)
+
+    assert {category: [p['title'] for p in items] for category, items in result['categories'].items()} == {
+        # Yoga Pants could be fitness too; the first declared category wins
+        'apparel': ['Graphic Tee', 'Yoga Pants'],
+        'footwear': ['Trail Runner'],
+        'accessories': ['Weekend Carry-All'],
+        # 'tee' inside 'street' is not a match
+        'other': ['Street Style Cap'],
+    }
+    assert result['category_counts'] == {'apparel': 2, 'footwear': 1, 'accessories': 1, 'other': 1}
+    assert result['total_categorized'] == 5
+
+
+def test_keywords_match_word_prefixes_only(analyzer):
+    # Patterns anchor at the start of a word: plurals and inflections still
+    # match, keywords inside a longer word don't
+    result = analyzer.categorize_products([_product('Oxford Shirts'), _product('Whatnot Organizer')])
+    assert list(result['categories']) == ['apparel', 'other']
+
+    faqs = analyzer.analyze_faq_patterns([
+        {'question': 'Where is my shipment?', 'answer': 'Tracking is emailed.'},
+        {'question': 'How do I renew my membership?', 'answer': 'From your account.'},
+    ])
+    assert faqs['common_topics'] == {'shipping': 1}
+
+
+def test_categorize_products_uses_precomputed_texts(analyzer):
+    products = [_product('Mystery Box')]
+    result = analyzer.categorize_products(products, ['candle'])
+    assert result['category_counts'] == {'home': 1}
+
+
+def test_analyze_brand_text(analyzer):
+    text = 'Premium, SUSTAINABLE essentials made by a community of makers. Evergreen designs.'
+    insights = analyzer.analyze_brand_text(text)
+
+    # Themes come back in declaration order; 'green' inside 'Evergreen' is not a match
+    assert insights['key_themes'] == ['sustainability', 'quality', 'community']
+    assert insights['word_count'] == 11
+
+
+def test_analyze_faq_patterns(analyzer):
+    faqs = [
+        {'question': 'When will my order ship?', 'answer': 'Within two days.'},
+        {'question': 'Can I return or exchange an item?', 'answer': 'Yes, within 30 days.'},
+        {'question': 'Do you take PayPal or a credit card?', 'answer': 'Both.'},
+        {'question': 'What size fits best?', 'answer': 'Check the chart.'},
+    ]
+    patterns = analyzer.analyze_faq_patterns(faqs)
+
+    assert patterns['total_faqs'] == 4
+    # Each topic counts once per question, however many of its keywords appear
+    assert patterns['common_topics'] == {'shipping': 1, 'returns': 1, 'payment': 1, 'sizing': 1}
+    assert patterns['avg_answer_length'] == pytest.approx(sum(len(faq['answer']) for faq in faqs) / 4)
+
+
+def test_analyze_faq_patterns_without_faqs(analyzer):
+    assert analyzer.analyze_faq_patterns([]) == {
+        'total_faqs': 0,
+        'common_topics': {},
+        'avg_answer_length': 0,
+        'customer_concerns': []
+    }
+
+
+@pytest.fixture
+def scraper():
+    return EcommerceScraper()
+
+
+def _price_nodes(scraper, html, limit=20):
+    soup = BeautifulSoup(html, 'lxml')
+    found = scraper._price_strings(soup, limit)
+    # Same nodes, in the same order, as searching every text node on its own
+    assert found == soup.find_all(string=_PRICE_TEXT_RE, limit=limit)
+    return [str(node) for node in found]
+
+
+def test_price_strings_at_document_edges(scraper):
+    html = '<p>$10 off today</p><div><h3>Canvas Tote</h3><span>Sale</span></div><p>only €25</p>'
+    assert _price_nodes(scraper, html) == ['$10 off today', 'only €25']
+
+
+def test_price_strings_split_across_nodes(scraper):
+    # '$' and '19.99' only form a price when joined; neither node matches alone
+    assert _price_nodes(scraper, '<p><span>$</span><span>19.99</span></p>') == []
+    # A hit that runs into the next node counts for its own node when that node matches
+    assert _price_nodes(scraper, '<p><b>Was $5</b><i>.00, now £4.50</i></p>') == ['Was $5', '.00, now £4.50']
+
+
+def test_price_strings_counts_each_node_once(scraper):
+    html = ''.join(f'<li>From ${i}.00 to ${i}.99</li>' for i in range(30))
+    assert _price_nodes(scraper, html, limit=20) == [f'From ${i}.00 to ${i}.99' for i in range(20)]
+
+
+def test_price_strings_without_prices(scraper):
+    assert _price_nodes(scraper, '<p>Free shipping on orders over 50</p><p>No prices here</p>') == []
+    assert _price_nodes(scraper, '<html></html>') == []
+
+
+CONTACT_PAGE = b"""<html><body>
+<header>Questions? Email support@shop.example or call +1 (555) 123-4567.</header>
+<p>Wholesale: Wholesale.Team@shop-partners.co.uk | 555.987.6543</p>
+<p>UK office +44 2079460958, orders@shop.example, support@shop.example</p>
+<footer>Fax 555-222-3333 or toll free 18005550199. Copyright 2024.</footer>
+</body></html>"""
+
+
+def _baseline_contacts(text):
+    """Emails and phone numbers as the separate per-pattern scans found them."""
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    phones = [
+        match.group()
+        for pattern in (
+            r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+            r'(\+\d{1,3}[-.\s]?)?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+            r'(\+\d{1,3}[-.\s]?)?\d{10,}'
+        )
+        for match in re.finditer(pattern, text)
+    ]
+    return set(emails), set(phones)
+
+
+def test_contact_details_match_separate_scans(scraper, monkeypatch):
+    page = FetchedPage(url='https://shop.example', status_code=200, content=CONTACT_PAGE)
+    monkeypatch.setattr(scraper, '_get_page', lambda url: page if url == 'https://shop.example' else None)
+    monkeypatch.setattr(scraper, '_existing_urls', lambda base_url, paths: iter(()))
+
+    details = scraper.extract_contact_details('https://shop.example')
+
+    # One combined pass finds the same matches, deduplicated in page order
+    assert details['emails'] == ['support@shop.example', 'Wholesale.Team@shop-partners.co.uk', 'orders@shop.example']
+    assert details['phones'] == ['+1 (555) 123-4567', '555.987.6543', '+44 2079460958', '555-222-3333', '18005550199']
+    emails, phones = _baseline_contacts(page.text())
+    assert set(details['emails']) == emails
+    # The separate scans also reported 1800555019, a 10-digit prefix of the
+    # longer run; the combined pattern takes whole runs only
+    assert set(details['phones']) == {phone for phone in phones if not any(phone != other and phone in other for other in phones)}
+    assert details['address'] == []
+
+
+SOCIAL_PAGE = b"""<html><head><link rel="me" href="https://x.com/brandx"></head><body>
+<p>Follow @textonly for news or write to press@brand.example</p>
+<a href="mailto:hello@brand.example">Email us</a>
+<a href="/pages/about">About</a>
+<a href="/collections/all?ref=@homepage">Shop</a>
+<a href="https://www.instagram.com/brand_official/">Instagram</a>
+<a href="https://instagram.com/second_account">Also Instagram</a>
+<a href="https://www.facebook.com/BrandPage">Facebook</a>
+<a href="https://www.youtube.com/c/BrandTube/videos">YouTube</a>
+</body></html>"""
+
+
+def test_social_handles_come_from_link_targets(scraper, monkeypatch):
+    page = FetchedPage(url='https://brand.example', status_code=200, content=SOCIAL_PAGE)
+    monkeypatch.setattr(scraper, '_get_page', lambda url: page)
+
+    assert scraper.extract_social_handles('https://brand.example') == {
+        # First matching link in document order
+        'instagram': 'brand_official',
+        'facebook': 'BrandPage',
+        # From <link rel="me">
+        'twitter': 'brandx',
+        'youtube': 'BrandTube',
+    }
+
+
+def test_social_handles_ignore_mailto_and_page_text(scraper, monkeypatch):
+    html = b"""<p>Say hi @textonly</p>
+    <a href="mailto:hello@brand.example">Email</a>
+    <a href="/about">About</a><a href="https://brand.example/pages/faq">FAQ</a>"""
+    page = FetchedPage(url='https://brand.example', status_code=200, content=html)
+    monkeypatch.setattr(scraper, '_get_page', lambda url: page)
+
+    # The bare-@ Instagram pattern would otherwise pick up the email domain or the text mention
+    assert scraper.extract_social_handles('https://brand.example') == {}
+
+
+@pytest.fixture
+def probed(scraper, monkeypatch):
+    """Record HEAD probes and answer them from a per-host script."""
+    answers, probes = {}, []
+
+    def fake_head(url, **kwargs):
+        probes.append(url)
+        answer = answers[url.split('/')[2]]
+        if isinstance(answer, Exception):
+            raise answer
+        return type('Response', (), {'status_code': answer})()
+
+    monkeypatch.setattr(scraper.session, 'head', fake_head)
+    monkeypatch.setattr(scraper, 'rate_limiter', HostRateLimiter(requests_per_second=1000, burst=1000))
+    EcommerceScraper._shopify_hosts.clear()
+    yield answers, probes
+    EcommerceScraper._shopify_hosts.clear()
+
+
+def test_is_shopify_remembers_each_host(scraper, probed):
+    answers, probes = probed
+    answers.update({'store.example': 200, 'blog.example': 404})
+
+    assert scraper.is_shopify('https://store.example') is True
+    assert scraper.is_shopify('https://blog.example/about') is False
+    # Repeated hosts are answered from the memo, whatever the path or case
+    assert scraper.is_shopify('https://STORE.example/collections') is True
+    assert scraper.is_shopify('https://blog.example') is False
+    assert probes == ['https://store.example/products.json?limit=1', 'https://blog.example/products.json?limit=1']
+
+
+def test_is_shopify_assumes_yes_when_unknown(scraper, probed):
+    answers, probes = probed
+    answers.update({'down.example': requests.ConnectionError('reset'), 'busy.example': 503})
+
+    # Unknown answers keep the Shopify paths and are not remembered
+    assert scraper.is_shopify('https://down.example') is True
+    assert scraper.is_shopify('https://busy.example') is True
+    answers.update({'down.example': 404, 'busy.example': 404})
+    assert scraper.is_shopify('https://down.example') is False
+    assert scraper.is_shopify('https://busy.example') is False
+    assert len(probes) == 4
+
+
+def test_site_paths_drop_shopify_pages_for_other_platforms(scraper, probed):
+    answers, _probes = probed
+    answers.update({'store.example': 200, 'blog.example': 404})
+    paths = ['/pages/faq', '/faq', '/help']
+
+    assert scraper._site_paths('https://store.example', paths) == paths
+    assert scraper._site_paths('https://blog.example', paths) == ['/faq', '/help']